@@ -3127,8 +3127,8 @@ def instagram_account_info():
         
         if use_real_api:
             # Use real Instagram Graph API
-            from instagram_api import instagram_api
-            account_data = instagram_api.get_account_info()
+            from instagram_api import get_api
+            account_data = get_api().get_account_info()
         else:
             # Use demo/simulation data
             from social_media_tools import get_instagram_account_info
@@ -3220,10 +3220,10 @@ def instagram_follower_growth():
 def instagram_insights():
     """Get real Instagram account insights (analytics)."""
     try:
-        from instagram_api import instagram_api
+        from instagram_api import get_api
         metrics = request.args.get('metrics', '').split(',') if request.args.get('metrics') else None
         period = request.args.get('period', 'day')
-        insights_data = instagram_api.get_insights(metrics=metrics, period=period)
+        insights_data = get_api().get_insights(metrics=metrics, period=period)
         return jsonify(insights_data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -3232,10 +3232,10 @@ def instagram_insights():
 def instagram_media():
     """Get recent Instagram posts with engagement data."""
     try:
-        from instagram_api import instagram_api
+        from instagram_api import get_api, Post
         limit = int(request.args.get('limit', 10))
-        media_data = instagram_api.get_recent_media(limit=limit)
-        return jsonify({'media': media_data})
+        media_data = get_api().get_recent_media(limit=limit)
+        return jsonify({'media': [post._asdict() if isinstance(post, Post) else post for post in media_data]})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -3243,9 +3243,9 @@ def instagram_media():
 def instagram_real_follower_growth():
     """Get real Instagram follower growth data."""
     try:
-        from instagram_api import instagram_api
+        from instagram_api import get_api
         days = int(request.args.get('days', 30))
-        growth_data = instagram_api.get_follower_growth(days=days)
+        growth_data = get_api().get_follower_growth(days=days)
         return jsonify(growth_data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -3,10 +3,14 @@
 # Requires: requests, gitpython
 
 import os
+import sys
+import shutil
 import subprocess
 import requests
 import re
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 GITHUB_API = 'https://api.github.com'
 ODOO_REPO = 'https://github.com/odoo/odoo.git'
@@ -15,6 +19,27 @@ ODOO_REPO = 'https://github.com/odoo/odoo.git'
 username = os.environ.get('GITHUB_USERNAME', 'Yamkia')
 token = os.environ.get('GITHUB_TOKEN', '')  # Set GITHUB_TOKEN env var before running
 
+# Shared session so every GitHub API call reuses a pooled keep-alive connection
+# (no new TLS handshake per repo) and transient 5xx responses are retried.
+_SESSION = requests.Session()
+_SESSION.headers['Authorization'] = f'token {token}'
+_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504],
+                      allowed_methods=None, raise_on_status=False)))
+
+def _fast_rmtree(path):
+    """Delete a directory tree with one native OS call instead of a Python walk."""
+    try:
+        if sys.platform == 'win32':
+            subprocess.run(['cmd', '/c', 'rmdir', '/s', '/q', path], check=False)
+        else:
+            subprocess.run(['rm', '-rf', path], check=False)
+    except OSError:
+        pass
+    # Fall back to shutil if the native command was unavailable or left files behind
+    if os.path.exists(path):
+        shutil.rmtree(path, ignore_errors=True)
+
 def create_env_and_repo(odoo_version):
     folder = f'odoo-community-{odoo_version}'
     print(f"\nSetting up Odoo {odoo_version} in {folder}")
@@ -34,8 +59,7 @@ def create_env_and_repo(odoo_version):
             if item != '.venv':
                 item_path = os.path.join(folder, item)
                 if os.path.isdir(item_path):
-                    import shutil
-                    shutil.rmtree(item_path)
+                    _fast_rmtree(item_path)
                 else:
                     os.remove(item_path)
         subprocess.run(['git', 'clone', '--branch', odoo_version, '--depth', '1', ODOO_REPO, folder], check=True)
@@ -51,9 +75,8 @@ def create_env_and_repo(odoo_version):
     # Create GitHub repo
     repo_name = folder
     url = f"{GITHUB_API}/user/repos"
-    headers = {'Authorization': f'token {token}'}
     data = {'name': repo_name, 'private': False, 'description': f'Odoo Community Edition {odoo_version}'}
-    r = requests.post(url, json=data, headers=headers)
+    r = _SESSION.post(url, json=data)
     if r.status_code == 201:
         print(f"GitHub repo '{repo_name}' created.")
         repo_url = r.json()['clone_url']
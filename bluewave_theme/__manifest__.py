@@ -6,9 +6,7 @@
     "author": "Your Company",
     "license": "LGPL-3",
     "depends": ["web"],
-    "data": [
-        "views/assets.xml"
-    ],
+    "data": [],
     "assets": {
         "web.assets_backend": [
             "bluewave_theme/static/src/css/backend_theme.css",
@@ -1,42 +1,61 @@
 from odoo import api, fields, models
 
+_BW_PREFIX = "bluewave_tuner."
+
+# (field name, default) for every tuner variable stored in ir.config_parameter
+_BW_KEYS = (
+    ("bw_header", "#111c3d"),
+    ("bw_header_border", "#0b1329"),
+    ("bw_bg", "#0b1326"),
+    ("bw_panel", "#0f1f46"),
+    ("bw_text", "#e9f1ff"),
+    ("bw_muted", "#aab7d4"),
+    ("bw_accent", "#4a7bff"),
+    ("bw_border_opacity", 0.06),
+)
+_BW_DEFAULTS = dict(_BW_KEYS)
+
 
 class BluewaveThemeSettings(models.TransientModel):
     _inherit = "res.config.settings"
 
-    bw_header = fields.Char(string="Header color", default="#111c3d")
-    bw_header_border = fields.Char(string="Header border", default="#0b1329")
-    bw_bg = fields.Char(string="Background", default="#0b1326")
-    bw_panel = fields.Char(string="Panel", default="#0f1f46")
-    bw_text = fields.Char(string="Text", default="#e9f1ff")
-    bw_muted = fields.Char(string="Muted text", default="#aab7d4")
-    bw_accent = fields.Char(string="Accent", default="#4a7bff")
-    bw_border_opacity = fields.Float(string="Border opacity (0-1)", default=0.06)
+    bw_header = fields.Char(string="Header color", default=_BW_DEFAULTS["bw_header"])
+    bw_header_border = fields.Char(string="Header border", default=_BW_DEFAULTS["bw_header_border"])
+    bw_bg = fields.Char(string="Background", default=_BW_DEFAULTS["bw_bg"])
+    bw_panel = fields.Char(string="Panel", default=_BW_DEFAULTS["bw_panel"])
+    bw_text = fields.Char(string="Text", default=_BW_DEFAULTS["bw_text"])
+    bw_muted = fields.Char(string="Muted text", default=_BW_DEFAULTS["bw_muted"])
+    bw_accent = fields.Char(string="Accent", default=_BW_DEFAULTS["bw_accent"])
+    bw_border_opacity = fields.Float(string="Border opacity (0-1)", default=_BW_DEFAULTS["bw_border_opacity"])
+
+    @api.model
+    def _bw_read_params(self):
+        """Fetch all stored tuner parameters in a single query, keyed by param key.
+
+        Plain SQL is fine here: the keys are private to this module, and it
+        skips the ORM record load on a cold settings form.
+        """
+        self.env["ir.config_parameter"].flush_model(["key", "value"])
+        self.env.cr.execute(
+            "SELECT key, value FROM ir_config_parameter WHERE key LIKE %s",
+            (_BW_PREFIX + "%",),
+        )
+        return dict(self.env.cr.fetchall())
 
     @api.model
     def get_values(self):
         res = super().get_values()
-        ICP = self.env["ir.config_parameter"].sudo()
-        res.update(
-            bw_header=ICP.get_param("bluewave_tuner.bw_header", "#111c3d"),
-            bw_header_border=ICP.get_param("bluewave_tuner.bw_header_border", "#0b1329"),
-            bw_bg=ICP.get_param("bluewave_tuner.bw_bg", "#0b1326"),
-            bw_panel=ICP.get_param("bluewave_tuner.bw_panel", "#0f1f46"),
-            bw_text=ICP.get_param("bluewave_tuner.bw_text", "#e9f1ff"),
-            bw_muted=ICP.get_param("bluewave_tuner.bw_muted", "#aab7d4"),
-            bw_accent=ICP.get_param("bluewave_tuner.bw_accent", "#4a7bff"),
-            bw_border_opacity=float(ICP.get_param("bluewave_tuner.bw_border_opacity", 0.06)),
-        )
+        stored = self._bw_read_params()
+        res.update({name: stored.get(_BW_PREFIX + name, default) for name, default in _BW_KEYS})
+        res["bw_border_opacity"] = float(res["bw_border_opacity"])
         return res
 
     def set_values(self):
         super().set_values()
         ICP = self.env["ir.config_parameter"].sudo()
-        ICP.set_param("bluewave_tuner.bw_header", self.bw_header or "#111c3d")
-        ICP.set_param("bluewave_tuner.bw_header_border", self.bw_header_border or "#0b1329")
-        ICP.set_param("bluewave_tuner.bw_bg", self.bw_bg or "#0b1326")
-        ICP.set_param("bluewave_tuner.bw_panel", self.bw_panel or "#0f1f46")
-        ICP.set_param("bluewave_tuner.bw_text", self.bw_text or "#e9f1ff")
-        ICP.set_param("bluewave_tuner.bw_muted", self.bw_muted or "#aab7d4")
-        ICP.set_param("bluewave_tuner.bw_accent", self.bw_accent or "#4a7bff")
-        ICP.set_param("bluewave_tuner.bw_border_opacity", self.bw_border_opacity or 0.06)
+        stored = self._bw_read_params()
+        for name, default in _BW_KEYS:
+            value = str(self[name] or default)
+            # Only write changed values; each set_param clears the ormcache
+            if stored.get(_BW_PREFIX + name) != value:
+                ICP.set_param(_BW_PREFIX + name, value)
@@ -1,181 +1,333 @@
+import functools
+import hashlib
+import logging
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from dotenv import load_dotenv
+from typing import Optional
 
 # Load .env from the same directory as this config file.
 # Support multiple environment files: .env.development, .env.production, etc.
 base_dir = Path(__file__).parent
-# Allow override via APP_ENV or ENVIRONMENT environment variable
-env_name = os.getenv('APP_ENV') or os.getenv('ENVIRONMENT') or 'development'
-env_name = env_name.lower()
-
-candidate_files = []
-if env_name in ('production', 'prod'):
-    candidate_files = ['.env.production', '.env.prod', '.env']
-elif env_name in ('development', 'dev'):
-    candidate_files = ['.env.development', '.env']
-else:
-    candidate_files = [f'.env.{env_name}', '.env']
-
-env_path = None
-for fname in candidate_files:
-    p = base_dir / fname
-    if p.exists():
-        env_path = p
-        break
-
-# Fallback to plain .env if nothing else found
-if env_path is None:
-    env_path = base_dir / '.env'
-
-load_dotenv(dotenv_path=env_path)
-
-# --- API Keys ---
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # For OpenAI models
-OPENAI_API_BASE = os.getenv("OPENAI_API_BASE") # For custom OpenAI-compatible endpoints like OpenRouter
-# OpenRouter convenience variables (optional): if using OpenRouter, you can set these
-OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
-OPENROUTER_SITE = os.getenv("OPENROUTER_SITE")   # Will be used as HTTP-Referer header (recommended by OpenRouter)
-OPENROUTER_APP = os.getenv("OPENROUTER_APP")     # Will be used as X-Title header (recommended by OpenRouter)
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")  # For Google Gemini models
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY") # For Anthropic Claude models
-DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY") # For Deepgram voice transcription
-
-# Debug: Print loaded API keys (for troubleshooting only)
-print(f"[DEBUG] .env path: {env_path} (exists={env_path.exists()})")
-print(f"[DEBUG] Loaded OPENAI_API_KEY: {OPENAI_API_KEY}")
-print(f"[DEBUG] Loaded GOOGLE_API_KEY: {GOOGLE_API_KEY}")
-print(f"[DEBUG] Loaded LLM_PROVIDER: {os.getenv('LLM_PROVIDER')}")
-
-# --- Model Settings ---
-# Provider can be: "openai", "google", "anthropic", or "auto" (auto-detect based on available keys)
-LLM_PROVIDER_RAW = os.getenv("LLM_PROVIDER", "auto").lower()
-OPENAI_MODEL_NAME = os.getenv("OPENAI_MODEL_NAME", "gpt-4o-mini")
-GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-1.5-flash-latest")
-# Normalize Gemini alias: remove "-latest" if library/API rejects it
-if GEMINI_MODEL_NAME.endswith("-latest"):
-    GEMINI_MODEL_NAME = GEMINI_MODEL_NAME.replace("-latest", "")
-ANTHROPIC_MODEL_NAME = os.getenv("ANTHROPIC_MODEL_NAME", "claude-3-5-sonnet-20240620")
-
-# Auto-detect provider if requested. Allow explicitly disabling the agent by setting LLM_PROVIDER to 'none' or 'disabled'.
-if LLM_PROVIDER_RAW in ("", "auto"):
-    if OPENAI_API_BASE and isinstance(OPENAI_API_BASE, str) and "openrouter.ai" in OPENAI_API_BASE.lower() and (OPENAI_API_KEY or OPENROUTER_API_KEY):
-        LLM_PROVIDER = "openai"
-    elif OPENAI_API_KEY:
-        LLM_PROVIDER = "openai"
-    elif GOOGLE_API_KEY:
-        LLM_PROVIDER = "google"
-    elif ANTHROPIC_API_KEY:
-        LLM_PROVIDER = "anthropic"
+
+log = logging.getLogger(__name__)
+
+_TRUTHY = frozenset({'true', '1', 't', 'yes', 'y', 'on'})
+
+
+def _envbool(name: str, default: str) -> bool:
+    return (os.environ.get(name) or default).strip().lower() in _TRUTHY
+
+
+def _is_unset(value: Optional[str], placeholder: str) -> bool:
+    """True when a credential is missing or still contains its .env.example placeholder."""
+    return not value or placeholder in value
+
+
+def _resolve_env_path() -> Path:
+    # Allow override via APP_ENV or ENVIRONMENT environment variable
+    env_name = os.getenv('APP_ENV') or os.getenv('ENVIRONMENT') or 'development'
+    env_name = env_name.lower()
+
+    candidate_files = []
+    if env_name in ('production', 'prod'):
+        candidate_files = ['.env.production', '.env.prod', '.env']
+    elif env_name in ('development', 'dev'):
+        candidate_files = ['.env.development', '.env']
     else:
+        candidate_files = [f'.env.{env_name}', '.env']
+
+    for fname in candidate_files:
+        p = base_dir / fname
+        if p.exists():
+            return p
+
+    # Fallback to plain .env if nothing else found
+    return base_dir / '.env'
+
+
+def _preflight(p: Path) -> bool:
+    """Return True only if ``p`` is a readable, non-binary file worth handing to dotenv."""
+    if not p.is_file():
+        log.warning("No .env file at %s; using process environment only", p)
+        return False
+    if not os.access(p, os.R_OK):
+        log.warning(".env file %s is not readable; skipping", p)
+        return False
+    try:
+        with open(p, 'rb') as fh:
+            if b'\0' in fh.read(4096):
+                log.warning(".env file %s looks binary; skipping", p)
+                return False
+    except OSError as e:
+        log.warning("Could not read .env file %s: %s", p, e)
+        return False
+    return True
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    env_path: Path
+    # --- API Keys ---
+    OPENAI_API_KEY: Optional[str]
+    OPENAI_API_BASE: Optional[str]
+    OPENROUTER_API_KEY: Optional[str]
+    OPENROUTER_SITE: Optional[str]
+    OPENROUTER_APP: Optional[str]
+    GOOGLE_API_KEY: Optional[str]
+    ANTHROPIC_API_KEY: Optional[str]
+    DEEPGRAM_API_KEY: Optional[str]
+    # --- Model Settings ---
+    LLM_PROVIDER_RAW: str
+    LLM_PROVIDER: Optional[str]
+    OPENAI_MODEL_NAME: str
+    GEMINI_MODEL_NAME: str
+    ANTHROPIC_MODEL_NAME: str
+    # --- Agent Settings ---
+    AGENT_VERBOSE: bool
+    AGENT_PRELOAD: bool
+    AGENT_ENABLED: bool
+    # --- App Visibility Settings ---
+    ENABLE_EMAIL_APP: bool
+    ENABLE_ODOO_APP: bool
+    ENABLE_SOCIAL_MEDIA_APP: bool
+    ENABLE_TRAFFIC_APP: bool
+    ENABLE_BRAND_MANAGER_APP: bool
+    ENABLE_WEBSITE_HELPER_APP: bool
+    # --- CIPC / Zisandahub Integration ---
+    ENABLE_CIPC_APP: bool
+    CIPC_API_BASE_URL: Optional[str]
+    CIPC_API_KEY: Optional[str]
+    ZISANDAHUB_EMAIL: Optional[str]
+    # --- Input Settings ---
+    ENABLE_VOICE_INPUT: bool
+    # --- Email Credentials ---
+    IMAP_SERVER: Optional[str]
+    SMTP_SERVER: Optional[str]
+    SMTP_PORT: int
+    EMAIL_USER: Optional[str]
+    EMAIL_PASSWORD: Optional[str]
+    # --- Optional Odoo/Postgres Settings ---
+    POSTGRES_HOST: str
+    POSTGRES_PORT: int
+    ODOO_DB_USER: str
+    ODOO_DB_PASSWORD: str
+
+
+@functools.lru_cache(maxsize=1)
+def _load() -> Settings:
+    """Parse the .env file, read and validate all settings exactly once per process."""
+    env_path = _resolve_env_path()
+    # ENABLE_DOTENV=0 skips .env handling entirely (env comes from systemd/docker)
+    if _envbool("ENABLE_DOTENV", "True") and _preflight(env_path):
+        try:
+            # Imported lazily so deploys without a .env never load python-dotenv
+            from dotenv import load_dotenv
+        except ImportError:
+            log.warning("python-dotenv is not installed; ignoring %s", env_path)
+        else:
+            load_dotenv(dotenv_path=env_path, override=False)
+
+    # --- API Keys ---
+    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")  # For OpenAI models
+    OPENAI_API_BASE = os.getenv("OPENAI_API_BASE") # For custom OpenAI-compatible endpoints like OpenRouter
+    # OpenRouter convenience variables (optional): if using OpenRouter, you can set these
+    OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
+    OPENROUTER_SITE = os.getenv("OPENROUTER_SITE")   # Will be used as HTTP-Referer header (recommended by OpenRouter)
+    OPENROUTER_APP = os.getenv("OPENROUTER_APP")     # Will be used as X-Title header (recommended by OpenRouter)
+    GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")  # For Google Gemini models
+    ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY") # For Anthropic Claude models
+    DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY") # For Deepgram voice transcription
+
+    # --- Model Settings ---
+    # Provider can be: "openai", "google", "anthropic", or "auto" (auto-detect based on available keys)
+    LLM_PROVIDER_RAW = os.getenv("LLM_PROVIDER", "auto").lower()
+    OPENAI_MODEL_NAME = os.getenv("OPENAI_MODEL_NAME", "gpt-4o-mini")
+    GEMINI_MODEL_NAME = os.getenv("GEMINI_MODEL_NAME", "gemini-1.5-flash-latest")
+    # Normalize Gemini alias: remove "-latest" if library/API rejects it
+    if GEMINI_MODEL_NAME.endswith("-latest"):
+        GEMINI_MODEL_NAME = GEMINI_MODEL_NAME.replace("-latest", "")
+    ANTHROPIC_MODEL_NAME = os.getenv("ANTHROPIC_MODEL_NAME", "claude-3-5-sonnet-20240620")
+
+    uses_openrouter = "openrouter.ai" in (OPENAI_API_BASE or "").lower()
+
+    # Auto-detect provider if requested: first provider in this table with a key wins.
+    # Allow explicitly disabling the agent by setting LLM_PROVIDER to 'none' or 'disabled'.
+    provider_rules = (
+        ("openai", OPENAI_API_KEY or (uses_openrouter and OPENROUTER_API_KEY)),
+        ("google", GOOGLE_API_KEY),
+        ("anthropic", ANTHROPIC_API_KEY),
+    )
+    if LLM_PROVIDER_RAW in ("", "auto"):
         # No provider keys found: do not force a provider. Agent will be disabled.
+        LLM_PROVIDER = next((name for name, key in provider_rules if key), None)
+    elif LLM_PROVIDER_RAW in ("none", "disabled"):
         LLM_PROVIDER = None
-elif LLM_PROVIDER_RAW in ("none", "disabled"):
-    LLM_PROVIDER = None
-else:
-    LLM_PROVIDER = LLM_PROVIDER_RAW
-
-# --- Agent Settings ---
-AGENT_VERBOSE = os.getenv("AGENT_VERBOSE", "False").lower() in ('true', '1', 't')
-
-# Convenience flag for app code to check whether an LLM provider is configured
-AGENT_ENABLED = LLM_PROVIDER is not None
-
-
-# --- App Visibility Settings ---
-# Control which applications are enabled and visible in the UI.
-ENABLE_EMAIL_APP = os.getenv("ENABLE_EMAIL_APP", "True").lower() in ('true', '1', 't')
-ENABLE_ODOO_APP = os.getenv("ENABLE_ODOO_APP", "True").lower() in ('true', '1', 't')
-ENABLE_SOCIAL_MEDIA_APP = os.getenv("ENABLE_SOCIAL_MEDIA_APP", "False").lower() in ('true', '1', 't')
-ENABLE_TRAFFIC_APP = os.getenv("ENABLE_TRAFFIC_APP", "True").lower() in ('true', '1', 't')
-ENABLE_BRAND_MANAGER_APP = os.getenv("ENABLE_BRAND_MANAGER_APP", "True").lower() in ('true', '1', 't')
-ENABLE_WEBSITE_HELPER_APP = os.getenv("ENABLE_WEBSITE_HELPER_APP", "True").lower() in ('true', '1', 't')
-
-# --- CIPC / Zisandahub Integration ---
-# Enables the CIPC app and provides settings for fetching new business registrations.
-ENABLE_CIPC_APP = os.getenv("ENABLE_CIPC_APP", "False").lower() in ('true', '1', 't')
-CIPC_API_BASE_URL = os.getenv("CIPC_API_BASE_URL")
-CIPC_API_KEY = os.getenv("CIPC_API_KEY")
-ZISANDAHUB_EMAIL = os.getenv("ZISANDAHUB_EMAIL")
-
-# --- Input Settings ---
-ENABLE_VOICE_INPUT = os.getenv("ENABLE_VOICE_INPUT", "False").lower() in ('true', '1', 't')
-
-# --- Email Credentials ---
-IMAP_SERVER = os.getenv("IMAP_SERVER")
-SMTP_SERVER = os.getenv("SMTP_SERVER")
-SMTP_PORT = os.getenv("SMTP_PORT", "465") # Default to 465, common for SMTP_SSL
-EMAIL_USER = os.getenv("EMAIL_USER")
-EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
-
-# --- Configuration Validation ---
-# We centralize all critical configuration checks here to fail fast.
-
-# If user is using OpenRouter via the OpenAI-compatible API, allow OPENROUTER_API_KEY as a fallback
-if OPENAI_API_BASE and isinstance(OPENAI_API_BASE, str) and "openrouter.ai" in OPENAI_API_BASE.lower():
+    else:
+        LLM_PROVIDER = LLM_PROVIDER_RAW
+
+    # --- Agent Settings ---
+    AGENT_VERBOSE = _envbool("AGENT_VERBOSE", "False")
+    # Import the agent on a background thread at startup so the first request doesn't wait for it
+    AGENT_PRELOAD = _envbool("AGENT_PRELOAD", "False")
+
+    # Convenience flag for app code to check whether an LLM provider is configured
+    AGENT_ENABLED = LLM_PROVIDER is not None
+
+
+    # --- App Visibility Settings ---
+    # Control which applications are enabled and visible in the UI.
+    ENABLE_EMAIL_APP = _envbool("ENABLE_EMAIL_APP", "True")
+    ENABLE_ODOO_APP = _envbool("ENABLE_ODOO_APP", "True")
+    ENABLE_SOCIAL_MEDIA_APP = _envbool("ENABLE_SOCIAL_MEDIA_APP", "False")
+    ENABLE_TRAFFIC_APP = _envbool("ENABLE_TRAFFIC_APP", "True")
+    ENABLE_BRAND_MANAGER_APP = _envbool("ENABLE_BRAND_MANAGER_APP", "True")
+    ENABLE_WEBSITE_HELPER_APP = _envbool("ENABLE_WEBSITE_HELPER_APP", "True")
+
+    # --- CIPC / Zisandahub Integration ---
+    # Enables the CIPC app and provides settings for fetching new business registrations.
+    ENABLE_CIPC_APP = _envbool("ENABLE_CIPC_APP", "False")
+    CIPC_API_BASE_URL = os.getenv("CIPC_API_BASE_URL")
+    CIPC_API_KEY = os.getenv("CIPC_API_KEY")
+    ZISANDAHUB_EMAIL = os.getenv("ZISANDAHUB_EMAIL")
+
+    # --- Input Settings ---
+    ENABLE_VOICE_INPUT = _envbool("ENABLE_VOICE_INPUT", "False")
+
+    # --- Email Credentials ---
+    IMAP_SERVER = os.getenv("IMAP_SERVER")
+    SMTP_SERVER = os.getenv("SMTP_SERVER")
+    SMTP_PORT = os.getenv("SMTP_PORT", "465") # Default to 465, common for SMTP_SSL
+    EMAIL_USER = os.getenv("EMAIL_USER")
+    EMAIL_PASSWORD = os.getenv("EMAIL_PASSWORD")
+
+    # --- Configuration Validation ---
+    # We centralize all critical configuration checks here to fail fast.
+
+    # If user is using OpenRouter via the OpenAI-compatible API, allow OPENROUTER_API_KEY as a fallback
     # Treat placeholder OPENAI_API_KEY as unset so OPENROUTER_API_KEY can be used as a fallback
-    if (not OPENAI_API_KEY or (isinstance(OPENAI_API_KEY, str) and 'your-openai-api-key-here' in OPENAI_API_KEY)) and OPENROUTER_API_KEY:
+    if uses_openrouter and OPENROUTER_API_KEY and _is_unset(OPENAI_API_KEY, "your-openai-api-key-here"):
         OPENAI_API_KEY = OPENROUTER_API_KEY
 
-if LLM_PROVIDER is None:
-    # Agent explicitly disabled or no provider keys found; skip provider validation.
-    pass
-elif LLM_PROVIDER == "openai":
-    if OPENAI_API_BASE and isinstance(OPENAI_API_BASE, str) and "openrouter.ai" in OPENAI_API_BASE.lower():
+    # Collect every problem so a misconfigured deploy reports them all at once.
+    errors = []
+
+    # provider -> (key, placeholder, hint)
+    provider_keys = {
+        "openai": (OPENAI_API_KEY, "your-openai-api-key-here", "Please add your OpenAI API key."),
+        "google": (GOOGLE_API_KEY, "your-google-api-key-here",
+                   "Please get a key from https://aistudio.google.com/app/apikey and add it."),
+        "anthropic": (ANTHROPIC_API_KEY, "your-anthropic-api-key-here", "Please add your Anthropic API key."),
+    }
+    if LLM_PROVIDER is None:
+        # Agent explicitly disabled or no provider keys found; skip provider validation.
+        pass
+    elif LLM_PROVIDER not in provider_keys:
+        errors.append(f"Invalid LLM_PROVIDER '{LLM_PROVIDER}' after auto-detection. Must resolve to 'openai', 'google', or 'anthropic'.")
+    elif LLM_PROVIDER == "openai" and uses_openrouter:
         if not OPENAI_API_KEY:
-            raise ValueError(
+            errors.append(
                 "LLM_PROVIDER is 'openai' with OpenRouter base URL, but no API key was provided. "
                 "Set either OPENAI_API_KEY or OPENROUTER_API_KEY in your .env file."
             )
     else:
-        if not OPENAI_API_KEY or "your-openai-api-key-here" in OPENAI_API_KEY:
-            raise ValueError(
-                "LLM_PROVIDER is set to 'openai', but OPENAI_API_KEY is missing or is a placeholder in the .env file. "
-                "Please add your OpenAI API key."
+        key, placeholder, hint = provider_keys[LLM_PROVIDER]
+        if _is_unset(key, placeholder):
+            errors.append(
+                f"LLM_PROVIDER is set to '{LLM_PROVIDER}', but {LLM_PROVIDER.upper()}_API_KEY is missing "
+                f"or is a placeholder in the .env file. {hint}"
             )
-elif LLM_PROVIDER == "google":
-    if not GOOGLE_API_KEY or "your-google-api-key-here" in GOOGLE_API_KEY:
-        raise ValueError(
-            "LLM_PROVIDER is set to 'google', but GOOGLE_API_KEY is missing or is a placeholder in the .env file. "
-            "Please get a key from https://aistudio.google.com/app/apikey and add it."
-        )
-elif LLM_PROVIDER == "anthropic":
-    if not ANTHROPIC_API_KEY or "your-anthropic-api-key-here" in ANTHROPIC_API_KEY:
-        raise ValueError(
-            "LLM_PROVIDER is set to 'anthropic', but ANTHROPIC_API_KEY is missing or is a placeholder in the .env file. "
-            "Please add your Anthropic API key."
+
+    # 2. Check for Voice Input Dependencies
+    if ENABLE_VOICE_INPUT and _is_unset(DEEPGRAM_API_KEY, "your-deepgram-api-key-here"):
+        errors.append(
+            "ENABLE_VOICE_INPUT is set to 'true', but DEEPGRAM_API_KEY is missing or is a placeholder in the .env file. "
+            "Please add your Deepgram API key."
         )
-else:
-    raise ValueError(f"Invalid LLM_PROVIDER '{LLM_PROVIDER}' after auto-detection. Must resolve to 'openai', 'google', or 'anthropic'.")
-
-# 2. Check for Voice Input Dependencies
-if ENABLE_VOICE_INPUT and (not DEEPGRAM_API_KEY or "your-deepgram-api-key-here" in DEEPGRAM_API_KEY):
-    raise ValueError(
-        "ENABLE_VOICE_INPUT is set to 'true', but DEEPGRAM_API_KEY is missing or is a placeholder in the .env file. "
-        "Please add your Deepgram API key."
+
+    # 3. Check for Email Credentials
+    if ENABLE_EMAIL_APP:
+        if not all([IMAP_SERVER, SMTP_SERVER, EMAIL_USER, EMAIL_PASSWORD]) or \
+           EMAIL_USER == "your-email@example.com" or \
+           EMAIL_PASSWORD == "your-email-password" or \
+           IMAP_SERVER == "imap.example.com" or \
+           SMTP_SERVER == "smtp.example.com":
+            errors.append(
+                "ENABLE_EMAIL_APP is true, but email credentials (IMAP_SERVER, SMTP_SERVER, EMAIL_USER, EMAIL_PASSWORD) are missing or placeholders in the .env file. "
+                "Please add your email details or set ENABLE_EMAIL_APP to false."
+            )
+
+    # 4. Validate SMTP_PORT
+    try:
+        SMTP_PORT = int(SMTP_PORT)
+    except ValueError:
+        errors.append("SMTP_PORT in .env file must be a valid number.")
+
+    if errors:
+        raise ValueError("\n".join(errors))
+
+    if AGENT_VERBOSE:
+        # Never log raw keys; a short fingerprint is enough to tell keys apart.
+        log.debug("env=%s exists=%s provider=%s key_fp=%s", env_path, env_path.exists(), LLM_PROVIDER,
+                  hashlib.sha1((OPENAI_API_KEY or '').encode()).hexdigest()[:8])
+
+    # --- Optional Odoo/Postgres Settings (for local environments) ---
+    # These are used by the Odoo helper routes to create/run local Odoo databases.
+    POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
+    POSTGRES_PORT = int(os.getenv("POSTGRES_PORT", "5432"))
+    ODOO_DB_USER = os.getenv("ODOO_DB_USER", "odoo")
+    ODOO_DB_PASSWORD = os.getenv("ODOO_DB_PASSWORD", "odoo")
+
+    return Settings(
+        env_path=env_path,
+        OPENAI_API_KEY=OPENAI_API_KEY,
+        OPENAI_API_BASE=OPENAI_API_BASE,
+        OPENROUTER_API_KEY=OPENROUTER_API_KEY,
+        OPENROUTER_SITE=OPENROUTER_SITE,
+        OPENROUTER_APP=OPENROUTER_APP,
+        GOOGLE_API_KEY=GOOGLE_API_KEY,
+        ANTHROPIC_API_KEY=ANTHROPIC_API_KEY,
+        DEEPGRAM_API_KEY=DEEPGRAM_API_KEY,
+        LLM_PROVIDER_RAW=LLM_PROVIDER_RAW,
+        LLM_PROVIDER=LLM_PROVIDER,
+        OPENAI_MODEL_NAME=OPENAI_MODEL_NAME,
+        GEMINI_MODEL_NAME=GEMINI_MODEL_NAME,
+        ANTHROPIC_MODEL_NAME=ANTHROPIC_MODEL_NAME,
+        AGENT_VERBOSE=AGENT_VERBOSE,
+        AGENT_PRELOAD=AGENT_PRELOAD,
+        AGENT_ENABLED=AGENT_ENABLED,
+        ENABLE_EMAIL_APP=ENABLE_EMAIL_APP,
+        ENABLE_ODOO_APP=ENABLE_ODOO_APP,
+        ENABLE_SOCIAL_MEDIA_APP=ENABLE_SOCIAL_MEDIA_APP,
+        ENABLE_TRAFFIC_APP=ENABLE_TRAFFIC_APP,
+        ENABLE_BRAND_MANAGER_APP=ENABLE_BRAND_MANAGER_APP,
+        ENABLE_WEBSITE_HELPER_APP=ENABLE_WEBSITE_HELPER_APP,
+        ENABLE_CIPC_APP=ENABLE_CIPC_APP,
+        CIPC_API_BASE_URL=CIPC_API_BASE_URL,
+        CIPC_API_KEY=CIPC_API_KEY,
+        ZISANDAHUB_EMAIL=ZISANDAHUB_EMAIL,
+        ENABLE_VOICE_INPUT=ENABLE_VOICE_INPUT,
+        IMAP_SERVER=IMAP_SERVER,
+        SMTP_SERVER=SMTP_SERVER,
+        SMTP_PORT=SMTP_PORT,
+        EMAIL_USER=EMAIL_USER,
+        EMAIL_PASSWORD=EMAIL_PASSWORD,
+        POSTGRES_HOST=POSTGRES_HOST,
+        POSTGRES_PORT=POSTGRES_PORT,
+        ODOO_DB_USER=ODOO_DB_USER,
+        ODOO_DB_PASSWORD=ODOO_DB_PASSWORD,
     )
 
-# 3. Check for Email Credentials
-if ENABLE_EMAIL_APP:
-    if not all([IMAP_SERVER, SMTP_SERVER, EMAIL_USER, EMAIL_PASSWORD]) or \
-       EMAIL_USER == "your-email@example.com" or \
-       EMAIL_PASSWORD == "your-email-password" or \
-       IMAP_SERVER == "imap.example.com" or \
-       SMTP_SERVER == "smtp.example.com":
-        raise ValueError(
-            "ENABLE_EMAIL_APP is true, but email credentials (IMAP_SERVER, SMTP_SERVER, EMAIL_USER, EMAIL_PASSWORD) are missing or placeholders in the .env file. "
-            "Please add your email details or set ENABLE_EMAIL_APP to false."
-        )
 
-# 4. Validate SMTP_PORT
-try:
-    SMTP_PORT = int(SMTP_PORT)
-except ValueError:
-    raise ValueError("SMTP_PORT in .env file must be a valid number.")
-
-# --- Optional Odoo/Postgres Settings (for local environments) ---
-# These are used by the Odoo helper routes to create/run local Odoo databases.
-POSTGRES_HOST = os.getenv("POSTGRES_HOST", "localhost")
-POSTGRES_PORT = int(os.getenv("POSTGRES_PORT", "5432"))
-ODOO_DB_USER = os.getenv("ODOO_DB_USER", "odoo")
-ODOO_DB_PASSWORD = os.getenv("ODOO_DB_PASSWORD", "odoo")
\ No newline at end of file
+def __getattr__(name):
+    # PEP 562: settings are served from the cached Settings instance. Runtime
+    # overrides (e.g. `config.ENABLE_EMAIL_APP = False` from the settings page)
+    # become real module globals and take precedence over this hook.
+    try:
+        return getattr(_load(), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+# Load and validate at import so misconfiguration still fails fast.
+_load()
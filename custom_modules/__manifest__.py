@@ -1,6 +1,6 @@
 {
     "name": "Custom Modules",
-    "version": "1.0.0",
+    "version": "1.0.1",
     "summary": "Manage custom UI/CSS adjustments in one place.",
     "author": "Your Company",
     "license": "LGPL-3",
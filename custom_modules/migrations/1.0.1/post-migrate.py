@@ -0,0 +1,17 @@
+from odoo import api, SUPERUSER_ID
+
+
+def migrate(cr, version):
+    """Compress existing CSS overrides into the attachment-backed css_rules field once."""
+    cr.execute(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'custom_css_manager' AND column_name = 'css_rules_legacy'"
+    )
+    if not cr.fetchone():
+        return
+    env = api.Environment(cr, SUPERUSER_ID, {"active_test": False})
+    cr.execute("SELECT id, css_rules_legacy FROM custom_css_manager WHERE css_rules_legacy IS NOT NULL")
+    for record_id, css in cr.fetchall():
+        env["custom.css.manager"].browse(record_id).css_rules_text = css
+    env.flush_all()
+    cr.execute("ALTER TABLE custom_css_manager DROP COLUMN css_rules_legacy")
@@ -0,0 +1,8 @@
+def migrate(cr, version):
+    """Keep the old plain-text css_rules column so post-migrate can compress it."""
+    cr.execute(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_name = 'custom_css_manager' AND column_name = 'css_rules'"
+    )
+    if cr.fetchone():
+        cr.execute("ALTER TABLE custom_css_manager RENAME COLUMN css_rules TO css_rules_legacy")
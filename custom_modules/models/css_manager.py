@@ -1,4 +1,7 @@
-from odoo import fields, models
+import base64
+import zlib
+
+from odoo import api, fields, models
 
 
 class CssManager(models.Model):
@@ -7,5 +10,26 @@ class CssManager(models.Model):
 
     name = fields.Char(default="CSS Profile", required=True)
     notes = fields.Text(string="Notes")
-    css_rules = fields.Text(string="CSS Overrides")
+    # zlib-compressed UTF-8, kept in an attachment so list reads never load it
+    css_rules = fields.Binary(string="CSS Overrides (compressed)", attachment=True)
+    css_rules_text = fields.Text(
+        string="CSS Overrides", compute="_compute_css_rules_text", inverse="_inverse_css_rules_text"
+    )
     active = fields.Boolean(default=True)
+
+    @api.depends("css_rules")
+    def _compute_css_rules_text(self):
+        for record in self:
+            # bin_size would hand back a human-readable size instead of the data
+            data = record.with_context(bin_size=False).css_rules
+            if data:
+                record.css_rules_text = zlib.decompress(base64.b64decode(data)).decode("utf-8")
+            else:
+                record.css_rules_text = ""
+
+    def _inverse_css_rules_text(self):
+        for record in self:
+            if record.css_rules_text:
+                record.css_rules = base64.b64encode(zlib.compress(record.css_rules_text.encode("utf-8"), 5))
+            else:
+                record.css_rules = False
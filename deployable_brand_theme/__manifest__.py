@@ -1,6 +1,6 @@
 {
     "name": "GreenMotive White Label Theme",
-    "version": "1.1.3",
+    "version": "1.1.4",
     "summary": "Multi-brand white-label theme: switch UI per environment or website.",
     "category": "Theme/Website",
     "author": "Your Company",
@@ -9,6 +9,11 @@
     "depends": ["web", "website"],
     "assets": {
         "web.assets_backend": [
+            "deployable_brand_theme/static/src/scss/glassmorphism_theme.scss",
+            "deployable_brand_theme/static/src/scss/brand.scss",
+            "deployable_brand_theme/static/src/js/glassmorphism_theme.js",
+            "deployable_brand_theme/static/src/js/brand.js",
+            "deployable_brand_theme/static/src/js/brand_switcher.js",
             "deployable_brand_theme/static/src/css/backend_theme.css",
             "deployable_brand_theme/static/src/css/modern_dashboard.css",
         ],
@@ -18,7 +23,6 @@
         ],
     },
     "data": [
-        "views/assets.xml",
         "security/ir.model.access.csv",
         "data/brand_data.xml",
         "views/brand_views.xml",
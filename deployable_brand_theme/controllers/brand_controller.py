@@ -1,47 +1,46 @@
+import hashlib
+import os
+
 from odoo import http
 from odoo.http import request
 
+# path -> ((path, mtime_ns, size), body, etag); re-read only when the file changes
+_CSS_CACHE = {}
+
 
 class BrandPreviewController(http.Controller):
     
-    @http.route('/brand/preview/<int:brand_id>', type='http', auth='user', website=True)
+    @http.route('/brand/preview/<int:brand_id>', type='http', auth='user', website=True, sitemap=False)
     def brand_preview(self, brand_id, **kwargs):
         """Render a preview page with the selected brand applied."""
         brand = request.env['deployable.brand'].browse(brand_id)
         if not brand.exists():
             return request.not_found()
         
-        # Temporarily override website brand for preview
-        website = request.website
-        original_brand = website.brand_id
-        
-        try:
-            # Set preview brand
-            website.brand_id = brand
-            
-            values = {
-                'brand': brand,
-                'preview_mode': True,
-                'original_brand': original_brand,
-            }
-            
-            return request.render('deployable_brand_theme.brand_preview_template', values)
-        finally:
-            # Restore original brand
-            website.brand_id = original_brand
+        # The page only depends on the brand record, so repeat visits revalidate by ETag
+        etag = '"%s-%s"' % (brand.id, int(brand.write_date.timestamp()) if brand.write_date else 0)
+        cache_headers = [('ETag', etag), ('Cache-Control', 'private, max-age=30, stale-while-revalidate=60')]
+        if request.httprequest.headers.get('If-None-Match') == etag:
+            return request.make_response(b'', cache_headers, status=304)
+
+        # Render-only override: the preview brand goes through the QWeb context,
+        # so the website record is never written.
+        values = {
+            'brand': brand,
+            'website_brand': brand,
+            'preview_mode': True,
+            'original_brand': request.website.brand_id,
+        }
+        resp = request.render('deployable_brand_theme.brand_preview_template', values)
+        for name, value in cache_headers:
+            resp.headers[name] = value
+        return resp
     
     @http.route('/brand/api/list', type='json', auth='user')
     def brand_list(self):
         """Return list of all brands (JSON API)."""
-        brands = request.env['deployable.brand'].search([('is_active', '=', True)])
-        return [{
-            'id': b.id,
-            'name': b.name,
-            'code': b.code,
-            'primary_color': b.primary_color,
-            'secondary_color': b.secondary_color,
-            'logo_svg': b.logo_svg,
-        } for b in brands]
+        # Copy each dict so callers can never mutate the cached payload
+        return [dict(b) for b in request.env['deployable.brand']._cached_list_payload()]
     
     @http.route('/brand/apply/<int:brand_id>', type='json', auth='user')
     def apply_brand(self, brand_id):
@@ -51,7 +50,16 @@ class BrandPreviewController(http.Controller):
             return {'success': False, 'error': 'Brand not found'}
         
         website = request.website
-        website.brand_id = brand
+        if website.brand_id == brand:
+            # Already applied: skip the write and the cache invalidation it triggers
+            return {
+                'success': True,
+                'brand_code': brand.code,
+                'brand_name': brand.name,
+                'unchanged': True,
+            }
+        with request.env.cr.savepoint():
+            website.brand_id = brand
         
         return {
             'success': True,
@@ -62,16 +70,29 @@ class BrandPreviewController(http.Controller):
     @http.route('/deployable_brand_theme/dev_css.css', type='http', auth='public', website=True, csrf=False)
     def dev_css(self, **kwargs):
         """Serve a development override CSS file so local edits take effect immediately."""
-        import os
         css_file = os.path.join(os.path.dirname(__file__), '..', 'static', 'src', 'css', 'dev_overrides.css')
         css_file = os.path.normpath(css_file)
-        if os.path.exists(css_file):
+        try:
+            st = os.stat(css_file)
+        except FileNotFoundError:
+            css = '/* deployable_brand_theme dev_overrides.css not found */'
+            headers = [('Content-Type', 'text/css; charset=utf-8'), ('Cache-Control', 'no-cache, no-store, must-revalidate')]
+            return request.make_response(css, headers)
+        key = (css_file, st.st_mtime_ns, st.st_size)
+        entry = _CSS_CACHE.get(css_file)
+        if not entry or entry[0] != key:
             try:
-                with open(css_file, 'r', encoding='utf-8') as f:
-                    css = f.read()
+                with open(css_file, 'rb') as f:
+                    body = f.read()
             except Exception:
-                css = '/* Error reading dev_overrides.css */'
-        else:
-            css = '/* deployable_brand_theme dev_overrides.css not found */'
-        headers = [('Content-Type', 'text/css; charset=utf-8'), ('Cache-Control', 'no-cache, no-store, must-revalidate')]
-        return request.make_response(css, headers)
+                body = b'/* Error reading dev_overrides.css */'
+                headers = [('Content-Type', 'text/css; charset=utf-8'), ('Cache-Control', 'no-cache, no-store, must-revalidate')]
+                return request.make_response(body, headers)
+            entry = (key, body, '"%s"' % hashlib.md5(body).hexdigest())
+            _CSS_CACHE[css_file] = entry
+        _key, body, etag = entry
+        # no-cache still lets the browser keep the body, it just revalidates via ETag (cheap 304)
+        headers = [('Content-Type', 'text/css; charset=utf-8'), ('Cache-Control', 'no-cache'), ('ETag', etag)]
+        if request.httprequest.headers.get('If-None-Match') == etag:
+            return request.make_response(b'', headers, status=304)
+        return request.make_response(body, headers)
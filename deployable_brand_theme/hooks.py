@@ -9,8 +9,9 @@ def post_init_hook(env):
     WebsitePage = env["website.page"]
 
     # Get or create default brand
-    default_brand = Brand.search([("code", "=", "greenmotive")], limit=1)
-    if not default_brand:
+    # Plain existence probe: upgrades hit this path every time and need no ORM load
+    env.cr.execute("SELECT 1 FROM deployable_brand WHERE code = %s LIMIT 1", ("greenmotive",))
+    if not env.cr.fetchone():
         Brand.create(
             {
                 "name": "GreenMotive",
@@ -24,15 +25,16 @@ def post_init_hook(env):
     # Ensure hero landing page exists and is linked to the template
     try:
         template = env.ref("deployable_brand_theme.hero_landing_page")
-        WebsitePage.search([("url", "=", "/nexus-hero")], limit=1).unlink()
-        WebsitePage.create(
-            {
-                "name": "Nexus Hero Landing",
-                "url": "/nexus-hero",
-                "type": "qweb",
-                "view_id": template.id,
-            }
-        )
+        page = WebsitePage.search([("url", "=", "/nexus-hero")], limit=1)
+        vals = {"name": "Nexus Hero Landing", "type": "qweb", "view_id": template.id}
+        if page:
+            # Upsert: only write fields that actually differ instead of delete + recreate
+            current = {"name": page.name, "type": page.type, "view_id": page.view_id.id}
+            diff = {k: v for k, v in vals.items() if current[k] != v}
+            if diff:
+                page.write(diff)
+        else:
+            WebsitePage.create(dict(vals, url="/nexus-hero"))
     except Exception:
         # If template is missing for any reason, skip silently to not block install
         pass
@@ -45,10 +47,11 @@ def post_init_hook(env):
             for w in websites:
                 try:
                     mod._theme_load(w)
-                    w.write({'theme_id': mod.id})
                 except Exception:
                     # non-fatal; continue
                     pass
+            # One UPDATE for all websites instead of one per website
+            websites.write({'theme_id': mod.id})
     except Exception:
         # ensure post-init hook never fails the installation
         pass
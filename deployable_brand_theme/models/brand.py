@@ -1,4 +1,4 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 
 class DeployableBrand(models.Model):
     _name = 'deployable.brand'
@@ -15,6 +15,30 @@ class DeployableBrand(models.Model):
 
     website_ids = fields.One2many('website', 'brand_id', string='Websites')
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache()
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        self.env.registry.clear_cache()
+        return res
+
+    def unlink(self):
+        res = super().unlink()
+        self.env.registry.clear_cache()
+        return res
+
+    @api.model
+    @tools.ormcache('self.env.uid')
+    def _cached_list_payload(self):
+        """Active brands as plain dicts; cached until any brand changes."""
+        brands = self.search([('is_active', '=', True)])
+        # read() fetches every column in one SELECT and already includes 'id'
+        return tuple(brands.read(['name', 'code', 'primary_color', 'secondary_color', 'logo_svg']))
+
     def action_preview_brand(self):
         """Open brand preview in new window."""
         self.ensure_one()
@@ -30,13 +54,37 @@ class DeployableBrand(models.Model):
         Can be called remotely via XML-RPC (models.execute_kw) by our env-creator.
         """
         Module = self.env['ir.module.module'].search([('name', '=', 'deployable_brand_theme')], limit=1)
+        if not Module:
+            return True
         websites = self.env['website'].browse(website_id) if website_id else self.env['website'].search([])
-        if Module:
-            for w in websites:
-                try:
-                    Module._theme_load(w)
-                    w.write({'theme_id': Module.id})
-                except Exception:
-                    # best-effort only
-                    pass
+        # _theme_load reparses every theme view; skip websites already on this theme
+        todo = websites.filtered(lambda w: w.theme_id.id != Module.id)
+        if not todo:
+            return True
+        for w in todo:
+            try:
+                Module._theme_load(w)
+            except Exception:
+                # best-effort only
+                pass
+        todo.write({'theme_id': Module.id})
         return True
+
+    @api.model
+    def assign_to_website(self, brand_code, website_domain=None):
+        """Assign the brand with ``brand_code`` to a website in a single RPC.
+
+        Used by provision_brand.py so the brand lookup, website lookup and
+        write cost one XML-RPC round-trip. Targets the website matching
+        ``website_domain``, or the first website when no domain is given.
+        """
+        brand = self.search([('code', '=', brand_code)], limit=1)
+        if not brand:
+            return {'error': 'brand_not_found'}
+        domain = [('domain', '=', website_domain)] if website_domain else []
+        website = self.env['website'].search(domain, limit=1)
+        if not website:
+            return {'error': 'website_not_found'}
+        if website.brand_id != brand:
+            website.brand_id = brand
+        return {'website_id': website.id, 'brand_id': brand.id}
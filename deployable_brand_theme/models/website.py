@@ -1,10 +1,30 @@
-from odoo import models, fields
+from odoo import api, models, fields, tools
 
 class Website(models.Model):
     _inherit = 'website'
 
     brand_id = fields.Many2one('deployable.brand', string='Brand', ondelete='set null')
+    # Denormalized so theme resolution reads one column instead of joining the brand
+    brand_code = fields.Char(compute='_compute_brand_code', store=True)
+
+    @api.depends('brand_id.code')
+    def _compute_brand_code(self):
+        for website in self:
+            website.brand_code = website.brand_id.code
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'brand_id' in vals:
+            # brand code changes are invalidated by deployable.brand itself
+            self.env.registry.clear_cache()
+        return res
 
     def _get_brand_code(self):
         self.ensure_one()
-        return (self.brand_id.code or 'default') if self.brand_id else 'default'
+        return self._get_brand_code_cached(self.id)
+
+    @api.model
+    @tools.ormcache('website_id')
+    def _get_brand_code_cached(self, website_id):
+        """Brand code of ``website_id``; called on every render, so memoized."""
+        return self.browse(website_id).brand_code or 'default'
@@ -8,9 +8,15 @@ It can be called during deployment or CI/CD pipelines.
 Usage:
     python provision_brand.py --brand-code greenmotive --db-name production_db
     python provision_brand.py --brand-code techpro --db-name staging_db --website-domain staging.techpro.com
+    python provision_brand.py --brand-code techpro luxe --website-domain techpro.com --website-domain luxe.com
+    python provision_brand.py --jobs-file jobs.json
 """
 
 import argparse
+import concurrent.futures
+import json
+import sys
+import threading
 import xmlrpc.client
 import os
 
@@ -25,71 +31,149 @@ def get_odoo_credentials():
     }
 
 
-def connect_odoo(url, db, username, password):
-    """Establish connection to Odoo via XML-RPC."""
-    common = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common')
-    uid = common.authenticate(db, username, password, {})
-    if not uid:
-        raise ValueError("Authentication failed")
-    models = xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object')
-    return models, uid
+def make_transport(url):
+    """Return a transport to share between the proxies of one Odoo server.
+
+    xmlrpc.client transports keep their last HTTP(S) connection open, so
+    sharing one between /common and /object reuses a single keep-alive
+    connection instead of opening one per proxy.
+    """
+    if url.startswith('https://'):
+        return xmlrpc.client.SafeTransport()
+    return xmlrpc.client.Transport()
 
 
 def assign_brand_to_website(models, uid, db, password, brand_code, website_domain=None):
     """Assign a brand to a website by brand code."""
-    # Search for the brand
-    brand_ids = models.execute_kw(
+    # Brand lookup, website lookup and write run server-side in one round-trip.
+    # (Odoo's XML-RPC endpoint does not implement system.multicall.)
+    result = models.execute_kw(
         db, uid, password,
-        'deployable.brand', 'search',
-        [[['code', '=', brand_code]]]
+        'deployable.brand', 'assign_to_website',
+        # xmlrpc.client cannot marshal None, so only send the domain when given
+        [brand_code], {'website_domain': website_domain} if website_domain else {}
     )
     
-    if not brand_ids:
+    if result.get('error') == 'brand_not_found':
         print(f"❌ Brand with code '{brand_code}' not found!")
         return False
     
-    brand_id = brand_ids[0]
-    
-    # Find or create website
-    if website_domain:
-        website_ids = models.execute_kw(
-            db, uid, password,
-            'website', 'search',
-            [[['domain', '=', website_domain]]]
-        )
-    else:
-        # Default to first website
-        website_ids = models.execute_kw(
-            db, uid, password,
-            'website', 'search',
-            [[]], {'limit': 1}
-        )
-    
-    if not website_ids:
+    if result.get('error') == 'website_not_found':
         print(f"❌ No website found!")
         return False
     
-    website_id = website_ids[0]
-    
-    # Update website with brand
-    models.execute_kw(
-        db, uid, password,
-        'website', 'write',
-        [[website_id], {'brand_id': brand_id}]
-    )
-    
-    print(f"✅ Successfully assigned brand '{brand_code}' to website (ID: {website_id})")
+    print(f"✅ Successfully assigned brand '{brand_code}' to website (ID: {result['website_id']})")
     return True
 
 
+class BrandProvisioner:
+    """Runs brand assignment jobs against one or more Odoo databases.
+
+    Authenticates once per (url, db) pair and reuses the resulting uid for
+    every later job on that database. Transports are not thread-safe, so each
+    worker thread keeps its own proxy per URL.
+    """
+
+    def __init__(self, username, password):
+        self.username = username
+        self.password = password
+        self._pool: dict[tuple[str, str], int] = {}
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _models_proxy(self, url):
+        proxies = getattr(self._local, 'proxies', None)
+        if proxies is None:
+            proxies = self._local.proxies = {}
+        if url not in proxies:
+            transport = make_transport(url)
+            proxies[url] = (
+                xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/common', transport=transport),
+                xmlrpc.client.ServerProxy(f'{url}/xmlrpc/2/object', transport=transport),
+            )
+        return proxies[url]
+
+    def get_models_for(self, url, db):
+        """Return (models_proxy, uid) for db, authenticating on first use."""
+        common, models = self._models_proxy(url)
+        key = (url, db)
+        with self._pool_lock:
+            uid = self._pool.get(key)
+        if uid is None:
+            # Log in outside the lock so different databases authenticate in
+            # parallel; if two threads race on one key, the first uid wins
+            uid = common.authenticate(db, self.username, self.password, {})
+            if not uid:
+                raise ValueError(f"Authentication failed for database '{db}'")
+            with self._pool_lock:
+                uid = self._pool.setdefault(key, uid)
+        return models, uid
+
+    def run_job(self, job):
+        models, uid = self.get_models_for(job['url'], job['db'])
+        return assign_brand_to_website(models, uid, job['db'], self.password,
+                                       job['brand_code'], job.get('website_domain'))
+
+    def run(self, jobs, max_workers=8):
+        """Run jobs concurrently; returns one bool per job, in order."""
+        # XML-RPC calls block on socket I/O, so threads overlap the round-trips
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            return list(executor.map(self.run_job, jobs))
+
+
+def load_jobs_file(path, creds):
+    """Read a JSON list of jobs from path ('-' for stdin).
+
+    Each job is an object with 'brand_code' and optional 'website_domain',
+    'db' and 'url'; missing 'db'/'url' fall back to creds.
+    """
+    if path == '-':
+        raw = json.load(sys.stdin)
+    else:
+        with open(path, encoding='utf-8') as f:
+            raw = json.load(f)
+    if not isinstance(raw, list):
+        raise ValueError("Jobs file must contain a JSON list")
+    jobs = []
+    for entry in raw:
+        if not isinstance(entry, dict) or not entry.get('brand_code'):
+            raise ValueError(f"Invalid job (needs 'brand_code'): {entry!r}")
+        jobs.append({
+            'brand_code': entry['brand_code'],
+            'website_domain': entry.get('website_domain'),
+            'db': entry.get('db', creds['db']),
+            'url': entry.get('url', creds['url']),
+        })
+    return jobs
+
+
+def build_jobs(brand_codes, website_domains):
+    """Pair brand codes with website domains into (brand_code, website_domain) jobs."""
+    if not website_domains:
+        if len(brand_codes) > 1:
+            raise ValueError("Several --brand-code values need one --website-domain each")
+        return [(brand_codes[0], None)]
+    if len(brand_codes) == 1:
+        return [(brand_codes[0], domain) for domain in website_domains]
+    if len(brand_codes) != len(website_domains):
+        raise ValueError("Pass one --website-domain per --brand-code (or a single brand code)")
+    return list(zip(brand_codes, website_domains))
+
+
 def main():
     parser = argparse.ArgumentParser(description='Provision Odoo environment with specific brand')
-    parser.add_argument('--brand-code', required=True, help='Brand code (e.g., greenmotive, techpro, luxe)')
+    parser.add_argument('--brand-code', nargs='+',
+                        help='Brand code(s) (e.g., greenmotive, techpro, luxe)')
     parser.add_argument('--db-name', help='Database name (overrides ODOO_DB env var)')
-    parser.add_argument('--website-domain', help='Website domain to assign brand to')
+    parser.add_argument('--website-domain', action='append',
+                        help='Website domain to assign brand to (repeat to match several brand codes)')
     parser.add_argument('--odoo-url', help='Odoo URL (overrides ODOO_URL env var)')
+    parser.add_argument('--jobs-file',
+                        help="JSON list of jobs ({brand_code, website_domain?, db?, url?}); '-' reads stdin")
     
     args = parser.parse_args()
+    if bool(args.brand_code) == bool(args.jobs_file):
+        parser.error("Pass either --brand-code or --jobs-file")
     
     # Get credentials
     creds = get_odoo_credentials()
@@ -100,16 +184,29 @@ def main():
     if args.odoo_url:
         creds['url'] = args.odoo_url
     
-    print(f"🚀 Provisioning brand '{args.brand_code}' for database '{creds['db']}'...")
+    try:
+        if args.jobs_file:
+            jobs = load_jobs_file(args.jobs_file, creds)
+        else:
+            jobs = [
+                {'brand_code': code, 'website_domain': domain, 'db': creds['db'], 'url': creds['url']}
+                for code, domain in build_jobs(args.brand_code, args.website_domain)
+            ]
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    if not jobs:
+        parser.error("No jobs to run")
+    
+    databases = sorted({job['db'] for job in jobs})
+    brand_codes = dict.fromkeys(job['brand_code'] for job in jobs)
+    print(f"🚀 Provisioning brand(s) {', '.join(repr(code) for code in brand_codes)} "
+          f"for database(s) {', '.join(repr(db) for db in databases)}...")
     
     try:
-        models, uid = connect_odoo(creds['url'], creds['db'], creds['username'], creds['password'])
-        success = assign_brand_to_website(
-            models, uid, creds['db'], creds['password'],
-            args.brand_code, args.website_domain
-        )
+        provisioner = BrandProvisioner(creds['username'], creds['password'])
+        results = provisioner.run(jobs)
         
-        if success:
+        if all(results):
             print("🎉 Brand provisioning completed successfully!")
         else:
             print("⚠️ Brand provisioning encountered issues.")
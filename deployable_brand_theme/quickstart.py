@@ -58,31 +58,36 @@ def print_banner():
 """)
 
 
-def create_scss_brand_section(brand):
-    """Generate SCSS for a brand."""
-    return f"""
-body.brand-{brand['code']} {{
-  --brand-primary: {brand['primary']};
-  --brand-secondary: {brand['secondary']};
+SCSS_BRAND_TEMPLATE = """
+body.brand-{code} {{
+  --brand-primary: {primary};
+  --brand-secondary: {secondary};
   --brand-bg: #f7f7f7;
 }}
 """
 
-
-def create_brand_xml_record(brand):
-    """Generate XML record for a brand."""
-    return f"""
-  <record id="brand_{brand['code']}" model="deployable.brand">
-    <field name="name">{brand['name']}</field>
-    <field name="code">{brand['code']}</field>
-    <field name="primary_color">{brand['primary']}</field>
-    <field name="secondary_color">{brand['secondary']}</field>
-    <field name="logo_svg">/deployable_brand_theme/static/src/img/{brand['code']}-logo.svg</field>
+BRAND_XML_TEMPLATE = """
+  <record id="brand_{code}" model="deployable.brand">
+    <field name="name">{name}</field>
+    <field name="code">{code}</field>
+    <field name="primary_color">{primary}</field>
+    <field name="secondary_color">{secondary}</field>
+    <field name="logo_svg">/deployable_brand_theme/static/src/img/{code}-logo.svg</field>
     <field name="is_active" eval="True"/>
   </record>
 """
 
 
+def create_scss_brand_section(brand):
+    """Generate SCSS for a brand."""
+    return SCSS_BRAND_TEMPLATE.format_map(brand)
+
+
+def create_brand_xml_record(brand):
+    """Generate XML record for a brand."""
+    return BRAND_XML_TEMPLATE.format_map(brand)
+
+
 def show_demo_instructions():
     """Show instructions for demo mode."""
     print("\n" + "="*60)
@@ -135,20 +140,18 @@ def show_brand_creation_code():
     print("🔧 BRAND CREATION - Code Snippets")
     print("="*60)
     
-    print("\n📝 1. Add to data/brand_data.xml:")
-    print("-" * 60)
-    for brand in SAMPLE_BRANDS:
-        print(create_brand_xml_record(brand))
-    
-    print("\n🎨 2. Add to static/src/scss/brand.scss:")
-    print("-" * 60)
-    for brand in SAMPLE_BRANDS:
-        print(create_scss_brand_section(brand))
-    
-    print("\n📁 3. Add logo files to static/src/img/:")
-    print("-" * 60)
-    for brand in SAMPLE_BRANDS:
-        print(f"   • {brand['code']}-logo.svg")
+    # Build the whole listing first and write it once
+    sys.stdout.write("".join([
+        "\n📝 1. Add to data/brand_data.xml:\n",
+        "-" * 60 + "\n",
+        "".join(create_brand_xml_record(brand) + "\n" for brand in SAMPLE_BRANDS),
+        "\n🎨 2. Add to static/src/scss/brand.scss:\n",
+        "-" * 60 + "\n",
+        "".join(create_scss_brand_section(brand) + "\n" for brand in SAMPLE_BRANDS),
+        "\n📁 3. Add logo files to static/src/img/:\n",
+        "-" * 60 + "\n",
+        "".join(f"   • {brand['code']}-logo.svg\n" for brand in SAMPLE_BRANDS),
+    ]))
     
     print("\n✅ After adding these:")
     print("   1. Restart Odoo")
@@ -1,30 +1,149 @@
 from langchain_core.tools import tool
 from typing import List, Optional
+import codecs
+import functools
 import imaplib
 import email
+import email.policy
+import queue
+import re
 import smtplib
+import threading
 from email.header import decode_header
+from email.parser import BytesHeaderParser
 from email.utils import parseaddr
 from contextlib import contextmanager
 from email.message import EmailMessage
 import config
 import html2text
 
+# Idle, logged-in connections with INBOX selected. Reusing them skips the TLS
+# handshake, LOGIN and SELECT on every tool call / UI request.
+_IMAP_POOL_SIZE = 4
+_imap_pool = queue.LifoQueue(maxsize=_IMAP_POOL_SIZE)
+
+def _open_imap_connection():
+    """Opens a new IMAP connection, logs in and selects the inbox."""
+    mail = imaplib.IMAP4_SSL(config.IMAP_SERVER)
+    try:
+        mail.login(config.EMAIL_USER, config.EMAIL_PASSWORD)
+        mail.select("inbox")
+    except Exception:
+        _close_imap_connection(mail)
+        raise
+    return mail
+
+def _close_imap_connection(mail):
+    try:
+        mail.logout()
+    except Exception:
+        pass
+
 @contextmanager
 def _get_imap_connection():
-    """Context manager for handling IMAP connection, login, and inbox selection."""
+    """Context manager that checks out a logged-in, inbox-selected IMAP connection from the pool."""
     mail = None
+    while mail is None:
+        try:
+            candidate = _imap_pool.get_nowait()
+        except queue.Empty:
+            break
+        try:
+            # Liveness check; servers drop idle sessions after a while
+            candidate.noop()
+            mail = candidate
+        except (imaplib.IMAP4.error, OSError):
+            _close_imap_connection(candidate)
+    if mail is None:
+        mail = _open_imap_connection()
     try:
-        mail = imaplib.IMAP4_SSL(config.IMAP_SERVER)
-        mail.login(config.EMAIL_USER, config.EMAIL_PASSWORD)
-        mail.select("inbox")
         yield mail
-    finally:
-        if mail:
-            mail.logout()
+    except BaseException:
+        # The session may be mid-command or broken; never hand it out again
+        _close_imap_connection(mail)
+        raise
+    try:
+        _imap_pool.put_nowait(mail)
+    except queue.Full:
+        _close_imap_connection(mail)
+
+# Listing views only show sender, subject and a snippet, so fetch those headers
+# plus the start of the body instead of the whole RFC822 message (attachments
+# included). PEEK keeps the messages unread.
+_SUMMARY_FETCH = ('(BODY.PEEK[HEADER.FIELDS (SUBJECT FROM CONTENT-TYPE CONTENT-TRANSFER-ENCODING)] '
+                  'BODY.PEEK[TEXT]<0.2048>)')
+_FETCH_SEQ_RE = re.compile(rb'^(\d+) \(')
+
+# SEARCH criteria as bytes so imaplib sends them without re-encoding
+_CRIT_UNSEEN = b'(UNSEEN)'
+_CRIT_ALL = b'(ALL)'
+
+def _imap_quote(text: str) -> bytes:
+    """Quotes text as an RFC 3501 quoted string, escaping '\\' and '"'."""
+    escaped = text.replace('\\', '\\\\').replace('"', '\\"')
+    return b'"' + escaped.encode('utf-8') + b'"'
+
+_header_parser = BytesHeaderParser()
+_IDENTITY_CTE = frozenset(('', '7bit', '8bit', 'binary'))
+
+def _fetch_summaries(mail, email_ids) -> dict:
+    """
+    Fetches the summary parts of the given message ids.
+    Returns a dict mapping each id (bytes) to a (headers, body) tuple, where
+    headers is a headers-only email.message.Message and body is the decoded
+    text of the truncated first part.
+    """
+    status, msg_data = mail.fetch(b','.join(email_ids), _SUMMARY_FETCH)
+    if status != 'OK':
+        return {}
+    parts = {}
+    current = None
+    for response_part in msg_data:
+        if not isinstance(response_part, tuple):
+            continue
+        match = _FETCH_SEQ_RE.match(response_part[0])
+        if match:
+            current = match.group(1)
+        if current is None:
+            continue
+        section = b'header' if b'HEADER.FIELDS' in response_part[0] else b'text'
+        parts.setdefault(current, {})[section] = response_part[1] or b''
+
+    summaries = {}
+    for email_id, sections in parts.items():
+        headers = _header_parser.parsebytes(sections.get(b'header', b''))
+        summaries[email_id] = (headers, _summary_body(headers, sections))
+    return summaries
+
+def _summary_body(headers: email.message.Message, sections: dict) -> str:
+    """Decodes the truncated body; only builds a full MIME tree when it has to."""
+    text = sections.get(b'text', b'')
+    cte = headers.get('content-transfer-encoding', '').strip().lower()
+    if headers.get_content_type() == 'text/plain' and cte in _IDENTITY_CTE:
+        # Single plain-text part, nothing to walk or transfer-decode
+        return text.decode(_usable_charset(headers.get_content_charset()), 'ignore')
+    header = sections.get(b'header', b'').rstrip(b'\r\n') + b'\r\n\r\n'
+    return _get_body_from_msg(email.message_from_bytes(header + text, policy=email.policy.default))
+
+_SNIPPET_TRANS = str.maketrans({'\r': ' ', '\n': ' '})
+
+def _make_snippet(body: str, length: int) -> str:
+    """Returns the first `length` characters of body on one line, with '...' if truncated."""
+    snippet = body[:length].translate(_SNIPPET_TRANS).strip()
+    return snippet + '...' if len(body) > length else snippet
 
 def _decode_header(header):
     """Decodes email header to a readable string."""
+    if isinstance(header, str):
+        # Plain str headers are hashable and repeat a lot (newsletters, lists)
+        return _decode_header_cached(header)
+    return _decode_header_parts(header)
+
+@functools.lru_cache(maxsize=2048)
+def _decode_header_cached(header: str) -> str:
+    return _decode_header_parts(header)
+
+def _decode_header_parts(header):
     decoded_parts = decode_header(header)
     header_parts = []
     for part, encoding in decoded_parts:
@@ -34,6 +153,38 @@ def _decode_header(header):
             header_parts.append(part)
     return "".join(header_parts)
 
+_h2t_local = threading.local()
+
+def _html_to_markdown(html_body: str) -> str:
+    """Converts HTML to Markdown with a converter reused per thread (HTML2Text is not thread-safe)."""
+    h = getattr(_h2t_local, 'converter', None)
+    if h is None:
+        h = html2text.HTML2Text()
+        # Configure to ignore images and format links nicely.
+        h.ignore_images = True
+        _h2t_local.converter = h
+    return h.handle(html_body)
+
+@functools.lru_cache(maxsize=64)
+def _usable_charset(charset: Optional[str]) -> str:
+    """Returns charset if Python has a codec for it, else utf-8."""
+    if charset:
+        try:
+            codecs.lookup(charset)
+            return charset
+        except LookupError:
+            pass
+    return 'utf-8'
+
+def _part_text(part: email.message.EmailMessage) -> str:
+    """Decodes a leaf text part using its declared charset (RFC 2231 aware)."""
+    try:
+        return part.get_content()
+    except LookupError:
+        # Unknown charset name; decode leniently as utf-8 instead
+        payload = part.get_payload(decode=True) or b''
+        return payload.decode('utf-8', 'ignore')
+
 def _get_body_from_msg(msg: email.message.Message) -> str:
     """
     Extracts the body from an email.message.Message object.
@@ -53,28 +204,19 @@ def _get_body_from_msg(msg: email.message.Message) -> str:
                 continue
 
             if content_type == "text/plain" and not plain_text_body:
-                try:
-                    plain_text_body = part.get_payload(decode=True).decode(errors='ignore')
-                except Exception:
-                    continue
+                plain_text_body = _part_text(part)
+                if plain_text_body:
+                    # Plain text wins over HTML, so the rest of the tree is irrelevant
+                    break
             elif content_type == "text/html" and not html_body:
-                try:
-                    html_body = part.get_payload(decode=True).decode(errors='ignore')
-                except Exception:
-                    continue
+                html_body = _part_text(part)
     else:
         # Not a multipart message
         content_type = msg.get_content_type()
         if content_type == "text/plain":
-            try:
-                plain_text_body = msg.get_payload(decode=True).decode(errors='ignore')
-            except Exception:
-                pass
+            plain_text_body = _part_text(msg)
         elif content_type == "text/html":
-            try:
-                html_body = msg.get_payload(decode=True).decode(errors='ignore')
-            except Exception:
-                pass
+            html_body = _part_text(msg)
 
     # Prioritize plain text, but use HTML if plain text is not available
     if plain_text_body:
@@ -82,11 +224,7 @@ def _get_body_from_msg(msg: email.message.Message) -> str:
     
     if html_body:
         # Convert HTML to Markdown to preserve links and basic formatting.
-        h = html2text.HTML2Text()
-        # Configure to ignore images and format links nicely.
-        h.ignore_images = True
-        markdown_body = h.handle(html_body)
-        return markdown_body.strip()
+        return _html_to_markdown(html_body).strip()
         
     return "" # Return empty string if no body is found
 
@@ -98,7 +236,7 @@ def check_new_emails(max_results: int = 5) -> List[dict]:
     """
     try:
         with _get_imap_connection() as mail:
-            status, messages = mail.search(None, '(UNSEEN)')
+            status, messages = mail.search(None, _CRIT_UNSEEN)
             if status != 'OK':
                 return "Failed to search for emails."
 
@@ -107,27 +245,24 @@ def check_new_emails(max_results: int = 5) -> List[dict]:
                 return "No new unread emails found."
 
             emails = []
-            for email_id in reversed(email_ids[-max_results:]):
-                status, msg_data = mail.fetch(email_id, '(RFC822)')
-                if status != 'OK':
+            selected_ids = list(reversed(email_ids[-max_results:]))
+            # One FETCH round-trip for the whole selection
+            summaries = _fetch_summaries(mail, selected_ids)
+            for email_id in selected_ids:
+                summary = summaries.get(email_id)
+                if summary is None:
                     continue
+                msg, body = summary
+
+                subject = _decode_header(msg["subject"])
+                from_ = _decode_header(msg.get("from"))
 
-                for response_part in msg_data:
-                    if isinstance(response_part, tuple):
-                        msg = email.message_from_bytes(response_part[1])
-                        
-                        subject = _decode_header(msg["subject"])
-                        from_ = _decode_header(msg.get("from"))
-
-                        body = _get_body_from_msg(msg)
-                        snippet = (body[:100] + '...') if len(body) > 100 else body
-                        
-                        emails.append({
-                            "id": email_id.decode(),
-                            "from": from_,
-                            "subject": subject,
-                            "snippet": snippet.strip().replace('\r\n', ' ')
-                        })
+                emails.append({
+                    "id": email_id.decode(),
+                    "from": from_,
+                    "subject": subject,
+                    "snippet": _make_snippet(body, 100)
+                })
             return emails
     except imaplib.IMAP4.error as e:
         # Provide a more specific error for common authentication issues.
@@ -154,7 +289,7 @@ def read_email_content(email_id: str) -> str:
             if not msg_data or not isinstance(msg_data[0], tuple):
                 return f"No email found with ID {email_id}, or the ID is invalid."
             
-            msg = email.message_from_bytes(msg_data[0][1])
+            msg = email.message_from_bytes(msg_data[0][1], policy=email.policy.default)
             subject = _decode_header(msg["subject"])
             from_header = _decode_header(msg.get("from"))
             # Extract the address for easier use by the agent
@@ -194,6 +329,62 @@ def draft_reply(to: str, subject: str, body: str, in_reply_to: Optional[str] = N
     # The agent will now receive the full draft content as the tool's output, making it easy to show the user.
     return f"Draft created successfully. Here is the content for your review:\n\n---\n{draft_content}\n---"
 
+# One authenticated SMTP session shared by send_email calls, so bursts of
+# messages skip the TLS handshake and login. Closed after _SMTP_IDLE_SECONDS.
+_SMTP_IDLE_SECONDS = 60
+_smtp_lock = threading.Lock()
+_smtp_conn = None
+_smtp_idle_timer = None
+
+def _get_smtp():
+    """Returns the cached SMTP connection, (re)connecting if needed. Call with _smtp_lock held."""
+    global _smtp_conn
+    if _smtp_conn is not None:
+        try:
+            if _smtp_conn.noop()[0] == 250:
+                return _smtp_conn
+        except (smtplib.SMTPException, OSError):
+            pass
+        _close_smtp()
+
+    # Handle both SMTP_SSL (e.g., port 465) and STARTTLS (e.g., port 587).
+    if config.SMTP_PORT == 587:
+        server = smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT)
+        server.starttls()
+    else:
+        # Use SMTP_SSL for a secure connection from the start.
+        server = smtplib.SMTP_SSL(config.SMTP_SERVER, config.SMTP_PORT)
+    try:
+        server.login(config.EMAIL_USER, config.EMAIL_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    _smtp_conn = server
+    return server
+
+def _close_smtp():
+    """Closes the cached SMTP connection. Call with _smtp_lock held."""
+    global _smtp_conn
+    if _smtp_conn is not None:
+        try:
+            _smtp_conn.quit()
+        except (smtplib.SMTPException, OSError):
+            _smtp_conn.close()
+        _smtp_conn = None
+
+def _close_idle_smtp():
+    with _smtp_lock:
+        _close_smtp()
+
+def _schedule_smtp_idle_close():
+    """(Re)starts the idle timer. Call with _smtp_lock held."""
+    global _smtp_idle_timer
+    if _smtp_idle_timer is not None:
+        _smtp_idle_timer.cancel()
+    _smtp_idle_timer = threading.Timer(_SMTP_IDLE_SECONDS, _close_idle_smtp)
+    _smtp_idle_timer.daemon = True
+    _smtp_idle_timer.start()
+
 @tool
 def send_email(to: str, subject: str, body: str) -> str:
     """
@@ -208,20 +399,15 @@ def send_email(to: str, subject: str, body: str) -> str:
         msg['From'] = config.EMAIL_USER
         msg['To'] = to
 
-        # Connect to the SMTP server and send the email, handling both
-        # SMTP_SSL (e.g., port 465) and STARTTLS (e.g., port 587).
-        if config.SMTP_PORT == 587:
-            # Use STARTTLS
-            with smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT) as server:
-                server.starttls()
-                server.login(config.EMAIL_USER, config.EMAIL_PASSWORD)
-                server.send_message(msg)
-        else:
-            # Use SMTP_SSL for a secure connection from the start.
-            with smtplib.SMTP_SSL(config.SMTP_SERVER, config.SMTP_PORT) as server:
-                server.login(config.EMAIL_USER, config.EMAIL_PASSWORD)
-                server.send_message(msg)
-        
+        with _smtp_lock:
+            try:
+                _get_smtp().send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # The server dropped the cached session; reconnect once
+                _close_smtp()
+                _get_smtp().send_message(msg)
+            _schedule_smtp_idle_close()
+
         return f"Email sent successfully to {to}."
     except smtplib.SMTPAuthenticationError:
         return ("SMTP Authentication failed. Please check your email user and password. "
@@ -240,54 +426,49 @@ def list_emails_for_ui(limit: int = 20, page: int = 1, unread_only: bool = True,
     try:
         with _get_imap_connection() as mail:
             # Base search: UNSEEN or ALL
-            base_criteria = '(UNSEEN)' if unread_only else '(ALL)'
+            base_criteria = _CRIT_UNSEEN if unread_only else _CRIT_ALL
 
-            def _do_search(criteria_parts):
-                status, data = mail.search(None, *criteria_parts)
+            def _do_search(criteria_parts, charset=None):
+                status, data = mail.search(charset, *criteria_parts)
                 if status != 'OK':
                     return []
                 return [eid for eid in data[0].split() if eid]
 
             if query:
-                # Try SUBJECT and FROM, union them, then intersect with base
+                # Match SUBJECT or FROM within the base set in a single server-side search
                 q = query.strip()
-                base_ids = set(_do_search([base_criteria]))
-                ids_subject = set(_do_search([base_criteria, 'SUBJECT', f'"{q}"']))
-                ids_from = set(_do_search([base_criteria, 'FROM', f'"{q}"']))
-                email_ids = list(base_ids.intersection(ids_subject.union(ids_from)))
+                quoted = _imap_quote(q)
+                charset = None if q.isascii() else 'UTF-8'
+                email_ids = _do_search([base_criteria, b'OR', b'SUBJECT', quoted, b'FROM', quoted], charset)
             else:
                 email_ids = _do_search([base_criteria])
 
-            # Order newest first
-            email_ids = list(reversed(email_ids))
             total = len(email_ids)
             # Pagination
             page = max(1, int(page or 1))
             limit = max(1, int(limit or 20))
             start = (page - 1) * limit
             end = start + limit
-            slice_ids = email_ids[start:end]
+            # SEARCH returns ids oldest first; slice the page from the tail and
+            # reverse just that page instead of the whole mailbox listing.
+            slice_ids = email_ids[max(0, total - end):max(0, total - start)][::-1]
             has_more = end < total
 
             emails = []
+            summaries = _fetch_summaries(mail, slice_ids) if slice_ids else {}
             for email_id in slice_ids:
-                status, msg_data = mail.fetch(email_id, '(RFC822)')
-                if status != 'OK':
+                summary = summaries.get(email_id)
+                if summary is None:
                     continue
-                for response_part in msg_data:
-                    if isinstance(response_part, tuple):
-                        msg = email.message_from_bytes(response_part[1])
-                        subject = _decode_header(msg.get('subject', ''))
-                        from_ = _decode_header(msg.get('from', ''))
-                        body = _get_body_from_msg(msg)
-                        snippet = (body[:120] + '...') if len(body) > 120 else body
-                        emails.append({
-                            'id': email_id.decode(),
-                            'from': from_,
-                            'subject': subject,
-                            'snippet': (snippet or '').strip().replace('\r\n', ' ')
-                        })
-                        break
+                msg, body = summary
+                subject = _decode_header(msg.get('subject', ''))
+                from_ = _decode_header(msg.get('from', ''))
+                emails.append({
+                    'id': email_id.decode(),
+                    'from': from_,
+                    'subject': subject,
+                    'snippet': _make_snippet(body, 120)
+                })
             return {'emails': emails, 'has_more': has_more, 'page': page}
     except imaplib.IMAP4.error as e:
         return {'error': f'IMAP error: {e}'}
@@ -3,14 +3,101 @@ Follower Quality Analyzer
 Detects fake followers and analyzes account authenticity similar to Modash.io
 """
 
-from typing import Dict, List
-from dataclasses import dataclass
+from typing import Dict, List, NamedTuple
+import math
+import operator
 import random
 from datetime import datetime, timedelta
 
+try:
+    import numpy as np
+except ImportError:  # optional: batch_analyze falls back to the per-account path
+    np = None
 
-@dataclass
-class FollowerAnalysis:
+try:
+    from numba import njit
+except ImportError:  # optional: the scoring kernels then run as plain Python
+    njit = None
+
+
+def _jit(func):
+    """Compile func with Numba when available; otherwise return it unchanged."""
+    if njit is None:
+        return func
+    # No fastmath: results must match the pure-Python path bit for bit
+    return njit(cache=True)(func)
+
+
+@_jit
+def _calculate_engagement_rate_nb(likes, comments, followers):
+    if followers == 0:
+        return 0.0
+    total_engagement = likes + comments
+    return (total_engagement / followers) * 100
+
+
+# Fake-follower signals as (metric, lo, hi, followers_lo, followers_hi, share):
+# a signal adds int(followers * share) when lo <= metric < hi and
+# followers_lo < followers < followers_hi. Metric 0 is the engagement rate,
+# 1 the following/follower ratio, 2 the post count. Rows of one signal have
+# disjoint ranges, which is what the original if/elif cascades selected.
+_INF = math.inf
+_FAKE_SIGNALS = (
+    # Signal 1: Low engagement rate
+    (0.0, -_INF, 0.5, 1000.0, _INF, 0.4),
+    (0.0, 0.5, 1.0, 5000.0, _INF, 0.25),
+    (0.0, 1.0, 2.0, 10000.0, _INF, 0.15),
+    # Signal 2: Abnormal following/follower ratio (following way more than
+    # followers, or too few following for the follower count)
+    (1.0, math.nextafter(3.0, _INF), _INF, 1000.0, _INF, 0.2),
+    (1.0, -_INF, 0.1, 0.0, 10000.0, 0.3),
+    # Signal 3: Low content but high followers
+    (2.0, -_INF, 10.0, 5000.0, _INF, 0.35),
+    (2.0, 10.0, 50.0, 20000.0, _INF, 0.25),
+    # Signal 4: Unrealistic follower count for the amount of content
+    (2.0, -_INF, 100.0, 50000.0, _INF, 0.4),
+)
+
+
+@_jit
+def _estimate_fake_followers_nb(followers, ratio, posts, engagement_rate):
+    metrics = (float(engagement_rate), float(ratio), float(posts))
+    fake_count = 0
+    # Branchless: each matching signal contributes its share, others add zero
+    for metric, lo, hi, f_lo, f_hi, share in _FAKE_SIGNALS:
+        value = metrics[int(metric)]
+        hit = (lo <= value) & (value < hi) & (f_lo < followers) & (followers < f_hi)
+        fake_count += hit * int(followers * share)
+
+    # Cap at 95% (even worst accounts have some real followers)
+    return min(fake_count, int(followers * 0.95))
+
+
+# Red-flag messages, formatted only for the accounts that trigger them
+_FLAG_LOW_ENGAGEMENT = "🚩 Very low engagement rate ({engagement_rate:.2f}%)"
+_FLAG_HIGH_FOLLOWING = "🚩 Following {ratio}x more than followers"
+_FLAG_LOW_FOLLOWING = "🚩 Unusually low following count (potential bought followers)"
+_FLAG_FEW_POSTS = "🚩 High followers ({followers}) but only {posts} posts"
+_FLAG_POST_RATIO = "🚩 Suspicious: {followers} followers with only {posts} posts"
+_FLAG_BELOW_AVERAGE = "🚩 Engagement rate below industry average (1-3%)"
+_FLAG_NONE = "✅ No major red flags detected"
+_FLAG_INSUFFICIENT = "ℹ️ Insufficient data"
+
+# Account fields read by analyze_account, fetched in one C-level call
+_ACCOUNT_KEYS = ('followers', 'following', 'posts', 'avg_likes', 'avg_comments')
+_ACCOUNT_DEFAULTS = dict.fromkeys(_ACCOUNT_KEYS, 0)
+_EXTRACT = operator.itemgetter(*_ACCOUNT_KEYS)
+
+# Below this many followers the signals are noise, so scoring is skipped
+_MIN_FOLLOWERS = 100
+_INSUFFICIENT_TIER = "Insufficient data"
+_INSUFFICIENT_RECOMMENDATIONS = (
+    "📊 Not enough followers yet for a reliable quality analysis",
+    "🚀 Focus on consistent, valuable content to grow your audience",
+)
+
+
+class FollowerAnalysis(NamedTuple):
     """Results of follower quality analysis"""
     total_followers: int
     suspicious_followers: int
@@ -21,6 +108,37 @@ class FollowerAnalysis:
     details: Dict
 
 
+class Metrics(NamedTuple):
+    """Per-account inputs and derived values, computed once per analysis"""
+    followers: int
+    following: int
+    posts: int
+    ratio: float  # following / followers, 0 without followers
+    engagement_rate: float
+    fake_count: int
+    fake_pct: float
+
+
+# Result shape for accounts under _MIN_FOLLOWERS; per-account fields and the
+# mutable red_flags/details are filled in with _replace
+_EMPTY_ANALYSIS_TEMPLATE = FollowerAnalysis(
+    total_followers=0,
+    suspicious_followers=0,
+    quality_score=0,
+    engagement_rate=0.0,
+    fake_percentage=0,
+    red_flags=None,
+    details=None
+)
+
+
+def _make_metrics(followers: int, following: int, posts: int, ratio: float,
+                  engagement_rate: float, fake_count: int) -> Metrics:
+    fake_pct = (fake_count / followers * 100) if followers > 0 else 0
+    return Metrics(followers, following, posts, ratio if followers > 0 else 0,
+                   engagement_rate, fake_count, fake_pct)
+
+
 class FollowerQualityAnalyzer:
     """
     Analyzes Instagram followers to detect fake/bot accounts.
@@ -44,6 +162,10 @@ class FollowerQualityAnalyzer:
             'no_engagement',
             'new_account_mass_following'
         ]
+        if njit is not None:
+            # Pay the JIT compile (or cache load) here rather than on the first analysis
+            _calculate_engagement_rate_nb(1, 1, 1)
+            _estimate_fake_followers_nb(1, 1.0, 1, 1.0)
     
     def analyze_account(self, account_data: Dict) -> FollowerAnalysis:
         """
@@ -55,53 +177,78 @@ class FollowerQualityAnalyzer:
         Returns:
             FollowerAnalysis with quality metrics
         """
-        followers = account_data.get('followers', 0)
-        following = account_data.get('following', 0)
-        posts = account_data.get('posts', 0)
-        avg_likes = account_data.get('avg_likes', 0)
-        avg_comments = account_data.get('avg_comments', 0)
+        try:
+            followers, following, posts, avg_likes, avg_comments = _EXTRACT(account_data)
+        except KeyError:
+            # Missing fields count as 0
+            followers, following, posts, avg_likes, avg_comments = _EXTRACT(
+                {**_ACCOUNT_DEFAULTS, **account_data}
+            )
+        
+        ratio = following / followers if followers > 0 else 0
         
         # Calculate engagement rate
         engagement_rate = self._calculate_engagement_rate(
             avg_likes, avg_comments, followers
         )
         
+        if followers < _MIN_FOLLOWERS:
+            return self._insufficient_analysis(followers, ratio, posts, engagement_rate)
+        
         # Analyze follower quality
         suspicious_count = self._estimate_fake_followers(
-            followers, following, posts, engagement_rate
+            followers, ratio, posts, engagement_rate
         )
         
-        fake_percentage = (suspicious_count / followers * 100) if followers > 0 else 0
-        quality_score = max(0, 100 - fake_percentage)
+        return self._build_analysis(_make_metrics(
+            followers, following, posts, ratio, engagement_rate, suspicious_count
+        ))
+    
+    def _build_analysis(self, metrics: Metrics, red_flags: List[str] = None) -> FollowerAnalysis:
+        """Package the scored metrics into a FollowerAnalysis"""
+        quality_score = max(0, 100 - metrics.fake_pct)
         
-        # Identify red flags
-        red_flags = self._identify_red_flags(
-            followers, following, posts, engagement_rate
-        )
+        # Identify red flags (the batch path passes them in precomputed)
+        if red_flags is None:
+            red_flags = self._identify_red_flags(metrics)
         
         # Detailed breakdown
-        details = self._generate_detailed_analysis(
-            followers, following, posts, engagement_rate, suspicious_count
-        )
+        details = self._generate_detailed_analysis(metrics)
         
         return FollowerAnalysis(
-            total_followers=followers,
-            suspicious_followers=suspicious_count,
+            total_followers=metrics.followers,
+            suspicious_followers=metrics.fake_count,
             quality_score=round(quality_score, 1),
-            engagement_rate=round(engagement_rate, 2),
-            fake_percentage=round(fake_percentage, 1),
+            engagement_rate=round(metrics.engagement_rate, 2),
+            fake_percentage=round(metrics.fake_pct, 1),
             red_flags=red_flags,
             details=details
         )
     
+    def _insufficient_analysis(self, followers: int, ratio: float, posts: int,
+                               engagement_rate: float) -> FollowerAnalysis:
+        """Result for accounts too small to score, without running the signals"""
+        return _EMPTY_ANALYSIS_TEMPLATE._replace(
+            total_followers=followers,
+            engagement_rate=round(engagement_rate, 2),
+            red_flags=[_FLAG_INSUFFICIENT],
+            details={
+                'quality_tier': _INSUFFICIENT_TIER,
+                'real_followers_estimate': followers,
+                'suspicious_followers_estimate': 0,
+                'following_ratio': round(ratio, 2),
+                'posts_per_1k_followers': round((posts / followers * 1000), 1) if followers > 0 else 0,
+                'engagement_tier': _INSUFFICIENT_TIER,
+                'authenticity_score': 0,
+                'recommendations': list(_INSUFFICIENT_RECOMMENDATIONS)
+            }
+        )
+    
     def _calculate_engagement_rate(self, likes: int, comments: int, followers: int) -> float:
         """Calculate engagement rate percentage"""
-        if followers == 0:
-            return 0.0
-        total_engagement = likes + comments
-        return (total_engagement / followers) * 100
+        return float(_calculate_engagement_rate_nb(likes, comments, followers))
     
-    def _estimate_fake_followers(self, followers: int, following: int, 
+    def _estimate_fake_followers(self, followers: int, ratio: float,
                                   posts: int, engagement_rate: float) -> int:
         """
         Estimate number of fake followers based on multiple signals.
@@ -112,78 +259,75 @@ class FollowerQualityAnalyzer:
         - Normal following ratio: 0.5-2.0
         - Suspicious: > 3.0 or < 0.1
         """
-        fake_count = 0
-        
-        # Signal 1: Low engagement rate
-        if engagement_rate < 0.5 and followers > 1000:
-            # Very low engagement suggests fake followers
-            fake_count += int(followers * 0.4)  # 40% fake
-        elif engagement_rate < 1.0 and followers > 5000:
-            fake_count += int(followers * 0.25)  # 25% fake
-        elif engagement_rate < 2.0 and followers > 10000:
-            fake_count += int(followers * 0.15)  # 15% fake
-        
-        # Signal 2: Abnormal following/follower ratio
-        if followers > 0:
-            ratio = following / followers
-            if ratio > 3.0 and followers > 1000:
-                # Following way more than followers
-                fake_count += int(followers * 0.2)
-            elif ratio < 0.1 and followers < 10000:
-                # Too few following for follower count (bought followers)
-                fake_count += int(followers * 0.3)
-        
-        # Signal 3: Low content but high followers
-        if posts < 10 and followers > 5000:
-            # Suspicious: high followers with little content
-            fake_count += int(followers * 0.35)
-        elif posts < 50 and followers > 20000:
-            fake_count += int(followers * 0.25)
-        
-        # Signal 4: Sudden follower spikes (would need historical data)
-        # For demo purposes, check for unrealistic ratios
-        if followers > 50000 and posts < 100:
-            fake_count += int(followers * 0.4)
-        
-        # Cap at 95% (even worst accounts have some real followers)
-        return min(fake_count, int(followers * 0.95))
+        return int(_estimate_fake_followers_nb(followers, float(ratio), posts, engagement_rate))
     
-    def _identify_red_flags(self, followers: int, following: int, 
-                           posts: int, engagement_rate: float) -> List[str]:
+    def _identify_red_flags(self, metrics: Metrics) -> List[str]:
         """Identify specific red flags in the account"""
+        followers, posts = metrics.followers, metrics.posts
+        engagement_rate, ratio = metrics.engagement_rate, metrics.ratio
         flags = []
         
         if engagement_rate < 0.5:
-            flags.append(f"🚩 Very low engagement rate ({engagement_rate:.2f}%)")
+            flags.append(_FLAG_LOW_ENGAGEMENT.format(engagement_rate=engagement_rate))
         
         if followers > 0:
-            ratio = following / followers
             if ratio > 3.0:
-                flags.append(f"🚩 Following {int(ratio)}x more than followers")
+                flags.append(_FLAG_HIGH_FOLLOWING.format(ratio=int(ratio)))
             elif ratio < 0.1 and followers > 5000:
-                flags.append(f"🚩 Unusually low following count (potential bought followers)")
+                flags.append(_FLAG_LOW_FOLLOWING)
         
         if posts < 10 and followers > 5000:
-            flags.append(f"🚩 High followers ({followers}) but only {posts} posts")
+            flags.append(_FLAG_FEW_POSTS.format(followers=followers, posts=posts))
         
         if followers > 50000 and posts < 100:
-            flags.append(f"🚩 Suspicious: {followers} followers with only {posts} posts")
+            flags.append(_FLAG_POST_RATIO.format(followers=followers, posts=posts))
         
         if engagement_rate < 1.0 and followers > 10000:
-            flags.append("🚩 Engagement rate below industry average (1-3%)")
+            flags.append(_FLAG_BELOW_AVERAGE)
         
         if not flags:
-            flags.append("✅ No major red flags detected")
+            flags.append(_FLAG_NONE)
         
         return flags
     
-    def _generate_detailed_analysis(self, followers: int, following: int,
-                                   posts: int, engagement_rate: float,
-                                   suspicious_count: int) -> Dict:
+    def _red_flag_lists(self, followers, following, posts, engagement_rate, ratio) -> List[List[str]]:
+        """
+        _identify_red_flags over whole arrays.
+        
+        Each check is one mask; strings are only formatted for the rows it
+        selects, in the same order the scalar version appends them.
+        """
+        flags = [[] for _ in range(len(followers))]
+        has_followers = followers > 0
+        checks = (
+            (engagement_rate < 0.5,
+             lambda i: _FLAG_LOW_ENGAGEMENT.format(engagement_rate=engagement_rate[i])),
+            (has_followers & (ratio > 3.0),
+             lambda i: _FLAG_HIGH_FOLLOWING.format(ratio=int(ratio[i]))),
+            (has_followers & (ratio <= 3.0) & (ratio < 0.1) & (followers > 5000),
+             lambda i: _FLAG_LOW_FOLLOWING),
+            ((posts < 10) & (followers > 5000),
+             lambda i: _FLAG_FEW_POSTS.format(followers=followers[i], posts=posts[i])),
+            ((followers > 50000) & (posts < 100),
+             lambda i: _FLAG_POST_RATIO.format(followers=followers[i], posts=posts[i])),
+            ((engagement_rate < 1.0) & (followers > 10000),
+             lambda i: _FLAG_BELOW_AVERAGE),
+        )
+        for mask, message in checks:
+            for i in np.flatnonzero(mask).tolist():
+                flags[i].append(message(i))
+        for row in flags:
+            if not row:
+                row.append(_FLAG_NONE)
+        return flags
+    
+    def _generate_detailed_analysis(self, metrics: Metrics) -> Dict:
         """Generate detailed breakdown of follower quality"""
+        followers, posts = metrics.followers, metrics.posts
+        engagement_rate, suspicious_count = metrics.engagement_rate, metrics.fake_count
+        fake_percentage = metrics.fake_pct
         
         real_followers = followers - suspicious_count
-        ratio = following / followers if followers > 0 else 0
         
         # Categorize quality
         if engagement_rate >= 3.0:
@@ -197,14 +341,11 @@ class FollowerQualityAnalyzer:
         else:
             quality_tier = "Poor"
         
-        # Estimate follower breakdown
-        fake_percentage = (suspicious_count / followers * 100) if followers > 0 else 0
-        
         return {
             'quality_tier': quality_tier,
             'real_followers_estimate': real_followers,
             'suspicious_followers_estimate': suspicious_count,
-            'following_ratio': round(ratio, 2),
+            'following_ratio': round(metrics.ratio, 2),
             'posts_per_1k_followers': round((posts / followers * 1000), 1) if followers > 0 else 0,
             'engagement_tier': quality_tier,
             'authenticity_score': max(0, 100 - fake_percentage),
@@ -235,8 +376,102 @@ class FollowerQualityAnalyzer:
     
     def batch_analyze(self, accounts: List[Dict]) -> List[FollowerAnalysis]:
         """Analyze multiple accounts"""
+        if np is not None:
+            return self.batch_analyze_vec(accounts)
         return [self.analyze_account(account) for account in accounts]
     
+    def batch_analyze_vec(self, accounts: List[Dict]) -> List[FollowerAnalysis]:
+        """
+        Analyze multiple accounts with the scoring done as NumPy array ops.
+        
+        Same results as analyze_account per account; only the packaging of
+        each FollowerAnalysis runs per account in Python.
+        """
+        if np is None:
+            return [self.analyze_account(account) for account in accounts]
+        if not accounts:
+            return []
+        followers, following, posts, engagement_rate, ratio, suspicious = self._score_arrays(accounts)
+        red_flags = self._red_flag_lists(followers, following, posts, engagement_rate, ratio)
+        
+        results = []
+        for f, fo, p, r, er, sc, flags in zip(followers.tolist(), following.tolist(), posts.tolist(),
+                                              ratio.tolist(), engagement_rate.tolist(),
+                                              suspicious.tolist(), red_flags):
+            if f < _MIN_FOLLOWERS:
+                results.append(self._insufficient_analysis(f, r, p, er))
+            else:
+                results.append(self._build_analysis(_make_metrics(f, fo, p, r, er, sc), flags))
+        return results
+    
+    def batch_analyze_arrays(self, accounts: List[Dict]) -> Dict:
+        """
+        Analyze multiple accounts into parallel NumPy arrays (requires NumPy).
+        
+        Returns a dict of arrays keyed like the FollowerAnalysis fields
+        (total_followers, suspicious_followers, quality_score, engagement_rate,
+        fake_percentage; scores unrounded) plus a 'red_flags' list of lists,
+        without allocating a FollowerAnalysis per account.
+        """
+        if np is None:
+            raise ImportError("batch_analyze_arrays requires numpy")
+        followers, following, posts, engagement_rate, ratio, suspicious = self._score_arrays(accounts)
+        fake_percentage = np.divide(suspicious, followers, out=np.zeros(len(accounts)),
+                                    where=followers > 0) * 100
+        quality_score = np.maximum(0.0, 100.0 - fake_percentage)
+        red_flags = self._red_flag_lists(followers, following, posts, engagement_rate, ratio)
+        
+        # Accounts too small to score, as in analyze_account
+        small = followers < _MIN_FOLLOWERS
+        suspicious[small] = 0
+        fake_percentage[small] = 0.0
+        quality_score[small] = 0.0
+        for i in np.flatnonzero(small).tolist():
+            red_flags[i] = [_FLAG_INSUFFICIENT]
+        
+        return {
+            'total_followers': followers,
+            'suspicious_followers': suspicious,
+            'quality_score': quality_score,
+            'engagement_rate': engagement_rate,
+            'fake_percentage': fake_percentage,
+            'red_flags': red_flags,
+        }
+    
+    def _score_arrays(self, accounts: List[Dict]):
+        """
+        NumPy scoring core shared by the batch paths.
+        
+        Returns (followers, following, posts, engagement_rate, ratio,
+        suspicious) arrays with the same values analyze_account computes per account.
+        """
+        n = len(accounts)
+        
+        def column(key, dtype):
+            return np.fromiter((account.get(key, 0) for account in accounts), dtype=dtype, count=n)
+        
+        followers = column('followers', np.int64)
+        following = column('following', np.int64)
+        posts = column('posts', np.int64)
+        engagement = column('avg_likes', np.float64) + column('avg_comments', np.float64)
+        
+        has_followers = followers > 0
+        f = followers.astype(np.float64)
+        engagement_rate = np.divide(engagement, f, out=np.zeros(n), where=has_followers) * 100
+        ratio = np.divide(following, f, out=np.zeros(n), where=has_followers)
+        
+        # Same signal table as _estimate_fake_followers_nb, one mask per row
+        metrics = (engagement_rate, ratio, posts)
+        fake_count = np.zeros(n)
+        for metric, lo, hi, f_lo, f_hi, share in _FAKE_SIGNALS:
+            value = metrics[int(metric)]
+            hit = (lo <= value) & (value < hi) & (f_lo < followers) & (followers < f_hi)
+            # np.trunc matches int() on the non-negative products
+            fake_count += np.where(hit, np.trunc(f * share), 0.0)
+        suspicious = np.minimum(fake_count, np.trunc(f * 0.95)).astype(np.int64)
+        
+        return followers, following, posts, engagement_rate, ratio, suspicious
+    
     def compare_accounts(self, account1: Dict, account2: Dict) -> Dict:
         """Compare two accounts side by side"""
         analysis1 = self.analyze_account(account1)
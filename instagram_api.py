@@ -1,10 +1,60 @@
 import os
+import time
+import functools
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from typing import Optional, Dict, List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, List, NamedTuple, Union
 from datetime import datetime
-from dotenv import load_dotenv
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # optional: fall back to requests' stdlib json decoding
+    orjson = None
+
+# How long a fetched account profile is reused before hitting the API again
+_ACCOUNT_INFO_TTL = 60
+
+
+class Post(NamedTuple):
+    """A media post with its engagement data (use _asdict() for JSON)"""
+    id: Optional[str]
+    caption: str
+    media_type: Optional[str]
+    media_url: Optional[str]
+    permalink: Optional[str]
+    timestamp: Optional[str]
+    likes: int
+    comments: int
+    engagement_rate: float
+
+
+def _require_configured(not_configured):
+    """Return not_configured() instead of calling the method when credentials are missing."""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self._configured:
+                return not_configured()
+            return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _not_configured() -> Dict:
+    """Default error payload for calls made without credentials."""
+    return {'error': 'Instagram API not configured'}
+
+
+def _parse_json(response: requests.Response):
+    """Decode a Graph API response body, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass  # let requests raise its own RequestException subclass
+    return response.json()
 
 class InstagramGraphAPI:
     """
@@ -12,20 +62,43 @@ class InstagramGraphAPI:
     Connects to real Instagram Business accounts via Meta's Graph API.
     """
     
+    _DEFAULT_METRICS = ('impressions', 'reach', 'profile_views', 'follower_count')
+    _DEFAULT_METRICS_CSV = ','.join(_DEFAULT_METRICS)
+    _ACCOUNT_FIELDS = 'username,name,biography,followers_count,follows_count,media_count,profile_picture_url'
+    _MEDIA_FIELDS = 'id,caption,media_type,media_url,permalink,timestamp,like_count,comments_count'
+    
     def __init__(self):
         self.app_id = os.getenv('INSTAGRAM_APP_ID')
         self.app_secret = os.getenv('INSTAGRAM_APP_SECRET')
         self.access_token = os.getenv('INSTAGRAM_ACCESS_TOKEN')
         self.business_account_id = os.getenv('INSTAGRAM_BUSINESS_ACCOUNT_ID')
         self.base_url = 'https://graph.facebook.com/v18.0'
+        # Query parameters as tuples: the auth pair is appended to each request,
+        # and the account lookup never changes
+        self._auth = (('access_token', self.access_token),)
+        self._account_info_params = (('fields', self._ACCOUNT_FIELDS),) + self._auth
+        # Keep-alive connections to graph.facebook.com. Rate limits (429) and
+        # transient 5xx are retried with exponential backoff, waiting out any
+        # Retry-After header; only idempotent requests are retried, so
+        # publishing is never sent twice
+        self.session = requests.Session()
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8,
+            max_retries=Retry(total=4, backoff_factor=0.5,
+                              status_forcelist=(429, 500, 502, 503, 504),
+                              respect_retry_after_header=True, raise_on_status=False)))
+        # (account info, time.monotonic() when fetched)
+        self._account_info_cache = (None, 0.0)
+        # Credentials are read once above, so this can't change later
+        self._configured = bool(self.access_token and self.business_account_id)
         
     def is_configured(self) -> bool:
         """Check if API credentials are properly configured."""
-        return all([
-            self.access_token,
-            self.business_account_id
-        ])
+        return self._configured
     
+    @_require_configured(lambda: {
+        'error': 'Instagram API not configured. Please set up your credentials.',
+        'setup_guide': 'See INSTAGRAM_API_SETUP.md for instructions'
+    })
     def get_account_info(self) -> Dict:
         """
         Get Instagram Business account information.
@@ -33,40 +106,24 @@ class InstagramGraphAPI:
         Returns:
             dict: Account information including username, follower count, etc.
         """
-        if not self.is_configured():
-            return {
-                'error': 'Instagram API not configured. Please set up your credentials.',
-                'setup_guide': 'See INSTAGRAM_API_SETUP.md for instructions'
-            }
+        cached, fetched_at = self._account_info_cache
+        if cached is not None and time.monotonic() - fetched_at < _ACCOUNT_INFO_TTL:
+            return cached
         
         try:
             url = f"{self.base_url}/{self.business_account_id}"
-            params = {
-                'fields': 'username,name,biography,followers_count,follows_count,media_count,profile_picture_url',
-                'access_token': self.access_token
-            }
-            
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=self._account_info_params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json(response)
             
-            # Transform to match our existing format
-            return {
-                'username': f"@{data.get('username', 'unknown')}",
-                'name': data.get('name', ''),
-                'account_type': 'Business',
-                'followers': data.get('followers_count', 0),
-                'following': data.get('follows_count', 0),
-                'posts': data.get('media_count', 0),
-                'bio': data.get('biography', ''),
-                'profile_picture': data.get('profile_picture_url', ''),
-                'verified': False,  # Graph API doesn't provide this in basic info
-                'last_updated': datetime.now().isoformat()
-            }
+            info = self._format_account(data)
+            self._account_info_cache = (info, time.monotonic())
+            return info
             
         except requests.exceptions.RequestException as e:
             return {'error': f'Failed to fetch account info: {str(e)}'}
     
+    @_require_configured(_not_configured)
     def get_insights(self, metrics: List[str] = None, period: str = 'day') -> Dict:
         """
         Get Instagram account insights (analytics).
@@ -78,28 +135,16 @@ class InstagramGraphAPI:
         Returns:
             dict: Account insights data
         """
-        if not self.is_configured():
-            return {'error': 'Instagram API not configured'}
-        
-        if metrics is None:
-            metrics = [
-                'impressions',
-                'reach',
-                'profile_views',
-                'follower_count'
-            ]
-        
         try:
             url = f"{self.base_url}/{self.business_account_id}/insights"
-            params = {
-                'metric': ','.join(metrics),
-                'period': period,
-                'access_token': self.access_token
-            }
+            params = (
+                ('metric', self._DEFAULT_METRICS_CSV if metrics is None else ','.join(metrics)),
+                ('period', period),
+            ) + self._auth
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json(response)
             
             # Transform insights data
             insights = {}
@@ -118,54 +163,99 @@ class InstagramGraphAPI:
         except requests.exceptions.RequestException as e:
             return {'error': f'Failed to fetch insights: {str(e)}'}
     
-    def get_recent_media(self, limit: int = 10) -> List[Dict]:
+    @_require_configured(lambda: [_not_configured()])
+    def get_recent_media(self, limit: int = 10, truncate_caption: bool = True) -> List[Union[Post, Dict]]:
         """
         Get recent media posts from the account.
         
         Args:
             limit: Number of posts to retrieve (max 25)
+            truncate_caption: Shorten captions to 100 characters for previews
         
         Returns:
-            list: List of media posts with engagement data
+            list: Post records with engagement data, or a single error dict
         """
-        if not self.is_configured():
-            return [{'error': 'Instagram API not configured'}]
-        
         try:
             # First, get media IDs
             url = f"{self.base_url}/{self.business_account_id}/media"
-            params = {
-                'fields': 'id,caption,media_type,media_url,permalink,timestamp,like_count,comments_count',
-                'limit': min(limit, 25),
-                'access_token': self.access_token
-            }
+            params = (
+                ('fields', self._MEDIA_FIELDS),
+                ('limit', min(limit, 25)),
+            ) + self._auth
             
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = _parse_json(response)
             
-            media_list = []
-            for item in data.get('data', []):
-                media_list.append({
-                    'id': item.get('id'),
-                    'caption': item.get('caption', '')[:100] + '...' if len(item.get('caption', '')) > 100 else item.get('caption', ''),
-                    'media_type': item.get('media_type'),
-                    'media_url': item.get('media_url'),
-                    'permalink': item.get('permalink'),
-                    'timestamp': item.get('timestamp'),
-                    'likes': item.get('like_count', 0),
-                    'comments': item.get('comments_count', 0),
-                    'engagement_rate': self._calculate_engagement_rate(
-                        item.get('like_count', 0),
-                        item.get('comments_count', 0)
-                    )
-                })
+            # One profile lookup for the whole batch instead of one per post
+            followers = self.get_account_info().get('followers', 1)
             
-            return media_list
+            return [self._format_media(item, followers, truncate_caption) for item in data.get('data', [])]
             
         except requests.exceptions.RequestException as e:
             return [{'error': f'Failed to fetch media: {str(e)}'}]
     
+    @_require_configured(_not_configured)
+    def get_profile_bundle(self, media_limit: int = 10) -> Dict:
+        """
+        Get account information and recent media in a single request.
+        
+        Uses Graph API field expansion on the account node, so the profile
+        and its latest posts come back in one round trip.
+        
+        Args:
+            media_limit: Number of posts to retrieve (max 25)
+        
+        Returns:
+            dict: 'account' information and 'media' list of Post records
+        """
+        try:
+            url = f"{self.base_url}/{self.business_account_id}"
+            params = (
+                ('fields', f'{self._ACCOUNT_FIELDS},media.limit({min(media_limit, 25)}){{{self._MEDIA_FIELDS}}}'),
+            ) + self._auth
+            
+            response = self.session.get(url, params=params, timeout=10)
+            response.raise_for_status()
+            data = _parse_json(response)
+            
+            info = self._format_account(data)
+            self._account_info_cache = (info, time.monotonic())
+            followers = info['followers']
+            media = data.get('media', {}).get('data', [])
+            
+            return {
+                'account': info,
+                'media': [self._format_media(item, followers) for item in media]
+            }
+            
+        except requests.exceptions.RequestException as e:
+            return {'error': f'Failed to fetch profile bundle: {str(e)}'}
+    
+    def fetch_all(self, media_limit: int = 10) -> Dict:
+        """
+        Fetch account info, insights and recent media concurrently.
+        
+        Args:
+            media_limit: Number of posts to retrieve (max 25)
+        
+        Returns:
+            dict: 'account', 'insights' and 'media' results
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            bundle = executor.submit(self.get_profile_bundle, media_limit)
+            insights = executor.submit(self.get_insights)
+            profile = bundle.result()
+            if 'error' in profile:
+                # Keep the shapes the individual getters return on failure
+                profile = {'account': profile, 'media': [profile]}
+            return {
+                'account': profile['account'],
+                'insights': insights.result(),
+                'media': profile['media']
+            }
+    
+    @_require_configured(_not_configured)
     def get_follower_growth(self, days: int = 30) -> Dict:
         """
         Get follower growth over time.
@@ -179,9 +269,6 @@ class InstagramGraphAPI:
         Returns:
             dict: Follower growth data
         """
-        if not self.is_configured():
-            return {'error': 'Instagram API not configured'}
-        
         try:
             # Get current follower count
             current_info = self.get_account_info()
@@ -199,6 +286,40 @@ class InstagramGraphAPI:
         except Exception as e:
             return {'error': f'Failed to fetch follower growth: {str(e)}'}
     
+    def _format_account(self, data: Dict) -> Dict:
+        """Transform a Graph API account node to match our existing format."""
+        return {
+            'username': f"@{data.get('username', 'unknown')}",
+            'name': data.get('name', ''),
+            'account_type': 'Business',
+            'followers': data.get('followers_count', 0),
+            'following': data.get('follows_count', 0),
+            'posts': data.get('media_count', 0),
+            'bio': data.get('biography', ''),
+            'profile_picture': data.get('profile_picture_url', ''),
+            'verified': False,  # Graph API doesn't provide this in basic info
+            'last_updated': datetime.now().isoformat()
+        }
+    
+    def _format_media(self, item: Dict, followers: int, truncate_caption: bool = True) -> Post:
+        """Transform a Graph API media node into a Post, adding its engagement rate."""
+        caption = item.get('caption') or ''
+        if truncate_caption and len(caption) > 100:
+            caption = caption[:100] + '...'
+        likes = item.get('like_count', 0)
+        comments = item.get('comments_count', 0)
+        return Post(
+            id=item.get('id'),
+            caption=caption,
+            media_type=item.get('media_type'),
+            media_url=item.get('media_url'),
+            permalink=item.get('permalink'),
+            timestamp=item.get('timestamp'),
+            likes=likes,
+            comments=comments,
+            engagement_rate=self._calculate_engagement_rate(likes, comments, followers=followers)
+        )
+    
     def _calculate_engagement_rate(self, likes: int, comments: int, followers: int = None) -> float:
         """Calculate engagement rate for a post."""
         if followers is None:
@@ -212,6 +333,7 @@ class InstagramGraphAPI:
         engagement = likes + comments
         return round((engagement / followers) * 100, 2)
     
+    @_require_configured(_not_configured)
     def publish_photo(self, image_url: str, caption: str) -> Dict:
         """
         Publish a photo to Instagram.
@@ -223,34 +345,27 @@ class InstagramGraphAPI:
         Returns:
             dict: Publishing result with media ID
         """
-        if not self.is_configured():
-            return {'error': 'Instagram API not configured'}
-        
         try:
             # Step 1: Create media container
             url = f"{self.base_url}/{self.business_account_id}/media"
-            params = {
-                'image_url': image_url,
-                'caption': caption,
-                'access_token': self.access_token
-            }
+            params = (
+                ('image_url', image_url),
+                ('caption', caption),
+            ) + self._auth
             
-            response = requests.post(url, params=params, timeout=10)
+            response = self.session.post(url, params=params, timeout=10)
             response.raise_for_status()
-            creation_data = response.json()
+            creation_data = _parse_json(response)
             
             container_id = creation_data.get('id')
             
             # Step 2: Publish the media container
             publish_url = f"{self.base_url}/{self.business_account_id}/media_publish"
-            publish_params = {
-                'creation_id': container_id,
-                'access_token': self.access_token
-            }
+            publish_params = (('creation_id', container_id),) + self._auth
             
-            publish_response = requests.post(publish_url, params=publish_params, timeout=10)
+            publish_response = self.session.post(publish_url, params=publish_params, timeout=10)
             publish_response.raise_for_status()
-            publish_data = publish_response.json()
+            publish_data = _parse_json(publish_response)
             
             return {
                 'success': True,
@@ -266,5 +381,11 @@ class InstagramGraphAPI:
             }
 
 
-# Create a global instance
-instagram_api = InstagramGraphAPI()
+@functools.lru_cache(maxsize=1)
+def get_api() -> InstagramGraphAPI:
+    """Return the shared Graph API client, created on first use."""
+    # Credentials already in the environment (systemd/docker) need no .env scan
+    if not os.getenv('INSTAGRAM_ACCESS_TOKEN'):
+        from dotenv import load_dotenv
+        load_dotenv()
+    return InstagramGraphAPI()
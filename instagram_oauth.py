@@ -4,22 +4,192 @@ Handles Instagram login and token management for accessing user data
 """
 
 import os
+import json
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import requests
-from datetime import datetime, timedelta
-from urllib.parse import urlencode
-from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlencode, quote_plus
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # optional: fall back to requests' stdlib json decoding
+    orjson = None
+
+# Shared session: app.py builds an InstagramOAuth per request, so the pool lives
+# at module level and every call reuses a keep-alive connection to
+# api.instagram.com / graph.instagram.com. Retries are handled by
+# InstagramOAuth._request, so the adapter itself never retries.
+_SESSION = requests.Session()
+_SESSION.headers.update({'User-Agent': 'webnexagent-instagram/1.0', 'Accept': 'application/json'})
+_SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=20))
+
+# Transient failures are retried with jittered exponential backoff
+# (1s, 2s, 4s, ... capped at 60s), waiting out Retry-After when sent. Only
+# idempotent methods are retried by default: the authorization code can only
+# be exchanged once, so a repeated POST would just fail.
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS'})
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 6
+_BACKOFF_INITIAL = 1
+_BACKOFF_MAX = 60
+
+# Media insight metrics, and the most requests the Graph batch endpoint accepts
+_MEDIA_INSIGHT_METRICS = 'engagement,impressions,reach,saved'
+_BATCH_LIMIT = 50
+
+
+def _parse_json(response):
+    """Decode a response body, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            pass  # let requests raise its own RequestException subclass
+    return response.json()
+
+# Instagram caps apps at roughly 200 calls per user per hour, so each access
+# token gets its own bucket; calls made before there is a token (the code
+# exchange) share the None bucket. A caller that would have to wait longer
+# than _RATE_LIMIT_MAX_WAIT fails fast rather than stalling a Flask thread.
+_RATE_LIMIT_CALLS = 200
+_RATE_LIMIT_PERIOD = 3600
+_RATE_LIMIT_MAX_WAIT = 5
+_RATE_LIMIT_MAX_USERS = 1024
+
+
+class _TokenBucket:
+    """
+    Thread-safe token bucket: allows bursts of up to `calls` requests, then
+    refills at calls/period per second so we throttle before Instagram 429s us
+    """
+    
+    def __init__(self, calls, period):
+        self.capacity = float(calls)
+        self.fill_rate = calls / period
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self, max_wait=None):
+        """
+        Take one token, sleeping until it is available
+        
+        Returns:
+            bool: False, without taking a token, if that would mean waiting
+            longer than max_wait seconds
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.fill_rate)
+            self.updated = now
+            wait = (1 - self.tokens) / self.fill_rate if self.tokens < 1 else 0
+            if max_wait is not None and wait > max_wait:
+                return False
+            # Reserve the token now (possibly going negative) so concurrent
+            # callers queue up behind each other instead of all waking at once
+            self.tokens -= 1
+        if wait:
+            time.sleep(wait)
+        return True
+
+
+_LIMITERS = {}  # access token -> _TokenBucket, oldest first
+_LIMITERS_LOCK = threading.Lock()
+
+
+def _limiter_for(access_token):
+    """Return the rate limiter for an access token, creating it on first use"""
+    with _LIMITERS_LOCK:
+        limiter = _LIMITERS.get(access_token)
+        if limiter is None:
+            while len(_LIMITERS) >= _RATE_LIMIT_MAX_USERS:
+                del _LIMITERS[next(iter(_LIMITERS))]
+            limiter = _LIMITERS[access_token] = _TokenBucket(_RATE_LIMIT_CALLS, _RATE_LIMIT_PERIOD)
+        return limiter
+
+
+def _access_token(kwargs):
+    """Pull the access token out of a request's params or form data"""
+    return (kwargs.get('params') or kwargs.get('data') or {}).get('access_token')
+
+
+class _TTLCache:
+    """Thread-safe cache whose entries expire `ttl` seconds after being stored"""
+    
+    def __init__(self, ttl, maxsize=1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.entries = {}  # key -> (expires_at, value)
+        self.lock = threading.Lock()
+    
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() >= entry[0]:
+                del self.entries[key]
+                return None
+            return entry[1]
+    
+    def set(self, key, value):
+        """Store a value, evicting the oldest entry when the cache is full"""
+        with self.lock:
+            self.entries.pop(key, None)
+            while len(self.entries) >= self.maxsize:
+                del self.entries[next(iter(self.entries))]  # oldest first
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+    
+    def pop(self, key):
+        """Drop an entry, if present"""
+        with self.lock:
+            self.entries.pop(key, None)
+    
+    def keys(self):
+        """Return a snapshot of the cached keys, including expired ones"""
+        with self.lock:
+            return list(self.entries)
+
+
+# Profiles change on a minutes-to-hours scale and media a little faster; both
+# are shared across the per-request InstagramOAuth instances
+_PROFILE_CACHE = _TTLCache(ttl=300)
+_MEDIA_CACHE = _TTLCache(ttl=60)
+
+# Responses that mean the access token was revoked or has expired
+_AUTH_ERROR_STATUSES = frozenset({401, 403})
+
+
+def _invalidate_token(access_token):
+    """Forget everything cached for an access token"""
+    _PROFILE_CACHE.pop(access_token)
+    for key in _MEDIA_CACHE.keys():
+        if key[0] == access_token:
+            _MEDIA_CACHE.pop(key)
 
 class InstagramOAuth:
     """Handle Instagram OAuth 2.0 authentication flow"""
     
+    # .env is parsed on first construction, not when the module is imported
+    _env_loaded = False
+    
     def __init__(self):
+        if not InstagramOAuth._env_loaded:
+            from dotenv import load_dotenv
+            load_dotenv()
+            InstagramOAuth._env_loaded = True
+        
         self.app_id = os.getenv('INSTAGRAM_APP_ID')
         self.app_secret = os.getenv('INSTAGRAM_APP_SECRET')
         self.redirect_uri = os.getenv('INSTAGRAM_REDIRECT_URI', 'http://127.0.0.1:5001/auth/instagram/callback')
         self.base_url = 'https://api.instagram.com'
         self.graph_url = 'https://graph.instagram.com'
+        self.batch_url = 'https://graph.facebook.com/'
+        self.session = _SESSION
 
         if not self.app_id or 'your_app_id_here' in self.app_id:
             raise ValueError(
@@ -34,6 +204,88 @@ class InstagramOAuth:
                 'Instagram Redirect URI is not configured. Set INSTAGRAM_REDIRECT_URI in your .env to your app callback URL.'
             )
         
+        # Everything but the optional state is fixed, so encode it once
+        self._auth_url_prefix = f"{self.base_url}/oauth/authorize?" + urlencode({
+            'client_id': self.app_id,
+            'redirect_uri': self.redirect_uri,
+            'scope': 'user_profile,user_media',
+            'response_type': 'code',
+        })
+    
+    def close(self):
+        """Release idle pooled sockets (the session reconnects on next use)"""
+        self.session.close()
+    
+    def _request(self, method, url, retry=None, **kwargs):
+        """
+        Send a throttled request, retrying connection errors, timeouts,
+        429s and 5xx responses with backoff
+        
+        Args:
+            retry: Whether to retry; defaults to True for idempotent methods
+            
+        Returns:
+            requests.Response: The successful response
+            
+        Raises:
+            requests.exceptions.RequestException: If the rate limit would
+                stall the caller, or once retries are exhausted
+        """
+        if not _limiter_for(_access_token(kwargs)).acquire(_RATE_LIMIT_MAX_WAIT):
+            raise requests.exceptions.RequestException('Instagram rate limit reached; try again later')
+        if retry is None:
+            retry = method in _IDEMPOTENT_METHODS
+        attempts = _RETRY_ATTEMPTS if retry else 1
+        
+        # Retries spend from the backoff, not the rate limit budget
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if last_attempt:
+                    raise
+                reason, retry_after = e, None
+            else:
+                if response.status_code not in _RETRY_STATUSES or last_attempt:
+                    response.raise_for_status()
+                    return response
+                reason, retry_after = f"HTTP {response.status_code}", response.headers.get('Retry-After')
+            
+            delay = min(_BACKOFF_INITIAL * 2 ** attempt, _BACKOFF_MAX) + random.uniform(0, 1)
+            if retry_after:
+                try:
+                    delay = min(float(retry_after), _BACKOFF_MAX)
+                except ValueError:
+                    pass  # HTTP-date form; keep the computed backoff
+            print(f"Instagram request failed ({reason}); retrying in {delay:.1f}s")
+            time.sleep(delay)
+    
+    def _call(self, method, url, action, **kwargs):
+        """
+        Send a request through _request and decode its JSON body
+        
+        Args:
+            action: What the call does, for the error message
+                (e.g. 'getting user profile')
+            
+        Returns:
+            dict: Decoded response, or None if the request failed
+        """
+        try:
+            return _parse_json(self._request(method, url, **kwargs))
+        except requests.exceptions.RequestException as e:
+            if isinstance(e, requests.exceptions.HTTPError) and e.response.status_code in _AUTH_ERROR_STATUSES:
+                _invalidate_token(_access_token(kwargs))
+            print(f"Error {action}: {e}")
+            return None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        
     def get_authorization_url(self, state=None):
         """
         Generate the Instagram OAuth authorization URL
@@ -44,17 +296,10 @@ class InstagramOAuth:
         Returns:
             str: Authorization URL to redirect user to
         """
-        params = {
-            'client_id': self.app_id,
-            'redirect_uri': self.redirect_uri,
-            'scope': 'user_profile,user_media',
-            'response_type': 'code',
-        }
-        
         if state:
-            params['state'] = state
-            
-        return f"{self.base_url}/oauth/authorize?{urlencode(params)}"
+            # quote_plus matches how urlencode encodes the other parameters
+            return f"{self._auth_url_prefix}&state={quote_plus(state)}"
+        return self._auth_url_prefix
     
     def exchange_code_for_token(self, code):
         """
@@ -76,13 +321,7 @@ class InstagramOAuth:
             'code': code
         }
         
-        try:
-            response = requests.post(url, data=data)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error exchanging code for token: {e}")
-            return None
+        return self._call('POST', url, 'exchanging code for token', data=data)
     
     def get_long_lived_token(self, short_lived_token):
         """
@@ -102,13 +341,7 @@ class InstagramOAuth:
             'access_token': short_lived_token
         }
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting long-lived token: {e}")
-            return None
+        return self._call('GET', url, 'getting long-lived token', params=params)
     
     def refresh_token(self, access_token):
         """
@@ -127,13 +360,7 @@ class InstagramOAuth:
             'access_token': access_token
         }
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error refreshing token: {e}")
-            return None
+        return self._call('GET', url, 'refreshing token', params=params)
     
     def get_user_profile(self, access_token):
         """
@@ -143,8 +370,12 @@ class InstagramOAuth:
             access_token: Instagram access token
             
         Returns:
-            dict: User profile data
+            dict: User profile data (cached per token for 5 minutes)
         """
+        profile = _PROFILE_CACHE.get(access_token)
+        if profile is not None:
+            return profile
+        
         url = f"{self.graph_url}/me"
         
         params = {
@@ -152,13 +383,10 @@ class InstagramOAuth:
             'access_token': access_token
         }
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting user profile: {e}")
-            return None
+        profile = self._call('GET', url, 'getting user profile', params=params)
+        if profile is not None:
+            _PROFILE_CACHE.set(access_token, profile)
+        return profile
     
     def get_user_media(self, access_token, limit=25):
         """
@@ -169,8 +397,12 @@ class InstagramOAuth:
             limit: Number of posts to retrieve
             
         Returns:
-            dict: Media data
+            dict: Media data (cached per token and limit for 1 minute)
         """
+        media = _MEDIA_CACHE.get((access_token, limit))
+        if media is not None:
+            return media
+        
         url = f"{self.graph_url}/me/media"
         
         params = {
@@ -179,13 +411,10 @@ class InstagramOAuth:
             'limit': limit
         }
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting user media: {e}")
-            return None
+        media = self._call('GET', url, 'getting user media', params=params)
+        if media is not None:
+            _MEDIA_CACHE.set((access_token, limit), media)
+        return media
     
     def get_media_insights(self, media_id, access_token):
         """
@@ -201,17 +430,50 @@ class InstagramOAuth:
         url = f"{self.graph_url}/{media_id}/insights"
         
         params = {
-            'metric': 'engagement,impressions,reach,saved',
+            'metric': _MEDIA_INSIGHT_METRICS,
             'access_token': access_token
         }
         
-        try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"Error getting media insights: {e}")
-            return None
+        return self._call('GET', url, 'getting media insights', params=params)
+    
+    def get_media_insights_batch(self, media_ids, access_token):
+        """
+        Get insights for several media items with one Graph API batch request
+        per 50 items
+        
+        Args:
+            media_ids: Instagram media IDs
+            access_token: Instagram access token
+            
+        Returns:
+            dict: Media insights data keyed by media ID (None for items that
+            failed), or None if a batch request failed
+        """
+        insights = {}
+        for start in range(0, len(media_ids), _BATCH_LIMIT):
+            chunk = media_ids[start:start + _BATCH_LIMIT]
+            data = {
+                'batch': json.dumps([
+                    {'method': 'GET', 'relative_url': f"{media_id}/insights?metric={_MEDIA_INSIGHT_METRICS}"}
+                    for media_id in chunk
+                ]),
+                'access_token': access_token
+            }
+            
+            # A batch of GETs is a read, so it is safe to retry despite the POST
+            results = self._call('POST', self.batch_url, 'getting media insights batch', retry=True, data=data)
+            if results is None:
+                return None
+            
+            # One result per request, in request order; failed items are null
+            # or carry a non-200 code
+            for media_id, result in zip(chunk, results):
+                if result and result.get('code') == 200:
+                    insights[media_id] = orjson.loads(result['body']) if orjson is not None else json.loads(result['body'])
+                else:
+                    insights[media_id] = None
+        
+        return insights
     
     def calculate_engagement_rate(self, likes, comments, followers):
         """
@@ -231,34 +493,35 @@ class InstagramOAuth:
         total_engagement = likes + comments
         return (total_engagement / followers) * 100
     
-    def get_comprehensive_account_data(self, access_token):
+    def get_comprehensive_account_data(self, access_token, include_insights=False):
         """
         Get comprehensive account data for AI analysis
         
         Args:
             access_token: Instagram access token
+            include_insights: Also fetch insights for each recent post
             
         Returns:
             dict: Complete account data including profile, media, and calculated metrics
         """
-        # Get profile
-        profile = self.get_user_profile(access_token)
+        # Profile and recent media are independent, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            profile_future = executor.submit(self.get_user_profile, access_token)
+            media_future = executor.submit(self.get_user_media, access_token, 25)
+            profile = profile_future.result()
+            media_data = media_future.result()
+        
         if not profile:
             return None
-        
-        # Get recent media
-        media_data = self.get_user_media(access_token, limit=25)
         if not media_data or 'data' not in media_data:
             return None
         
-        # Calculate metrics
-        total_likes = 0
-        total_comments = 0
-        post_count = len(media_data['data'])
-        
-        for post in media_data['data']:
-            total_likes += post.get('like_count', 0)
-            total_comments += post.get('comments_count', 0)
+        # Calculate metrics (sum() runs the accumulation in C)
+        posts = media_data['data']
+        post_count = len(posts)
+        total_likes = sum(post.get('like_count', 0) for post in posts)
+        total_comments = sum(post.get('comments_count', 0) for post in posts)
+        total_engagement = total_likes + total_comments
         
         avg_likes = total_likes / post_count if post_count > 0 else 0
         avg_comments = total_comments / post_count if post_count > 0 else 0
@@ -266,45 +529,59 @@ class InstagramOAuth:
         # Note: Instagram Basic Display API doesn't provide follower counts
         # User needs to upgrade to Instagram Graph API (Business/Creator account)
         
-        return {
+        account_data = {
             'username': profile.get('username'),
             'account_type': profile.get('account_type'),
             'media_count': profile.get('media_count'),
             'posts': post_count,
             'avg_likes_per_post': round(avg_likes, 2),
             'avg_comments_per_post': round(avg_comments, 2),
-            'total_engagement': total_likes + total_comments,
-            'recent_posts': media_data['data'][:10]  # Last 10 posts
+            'total_engagement': total_engagement,
+            'recent_posts': posts[:10]  # Last 10 posts
         }
+        
+        if include_insights:
+            account_data['media_insights'] = self.get_media_insights_batch(
+                [post['id'] for post in posts], access_token
+            )
+        
+        return account_data
 
 
-# Token storage (in production, use a database)
+# Token storage (in production, use a database). Expiry is kept as
+# expires_at_mono on the time.monotonic() clock, so wall-clock jumps can't
+# extend or cut short a token.
 _token_store = {}
+_TOKEN_STORE_MAX = 100_000
+
+def _purge_expired_tokens(now):
+    """Drop expired tokens, then the oldest ones if the store is still full"""
+    for user_id in [uid for uid, data in _token_store.items() if data['expires_at_mono'] <= now]:
+        del _token_store[user_id]
+    while len(_token_store) >= _TOKEN_STORE_MAX:
+        del _token_store[next(iter(_token_store))]
 
 def store_token(user_id, token_data):
     """Store user token data"""
+    now = time.monotonic()
+    _token_store.pop(user_id, None)
+    if len(_token_store) >= _TOKEN_STORE_MAX:
+        _purge_expired_tokens(now)
     _token_store[user_id] = {
         'access_token': token_data.get('access_token'),
         'token_type': token_data.get('token_type', 'Bearer'),
         'expires_in': token_data.get('expires_in'),
-        'created_at': datetime.now()
+        'expires_at_mono': now + (token_data.get('expires_in') or 0)
     }
 
 def get_token(user_id):
-    """Retrieve user token data"""
-    return _token_store.get(user_id)
+    """Retrieve user token data, or None once it has expired"""
+    token_data = _token_store.get(user_id)
+    if token_data is not None and time.monotonic() >= token_data['expires_at_mono']:
+        _token_store.pop(user_id, None)
+        return None
+    return token_data
 
 def token_is_valid(user_id):
     """Check if stored token is still valid"""
-    token_data = get_token(user_id)
-    if not token_data:
-        return False
-    
-    created_at = token_data.get('created_at')
-    expires_in = token_data.get('expires_in', 0)
-    
-    if not created_at:
-        return False
-    
-    expiry_time = created_at + timedelta(seconds=expires_in)
-    return datetime.now() < expiry_time
+    return time.monotonic() < (_token_store.get(user_id) or {}).get('expires_at_mono', 0)
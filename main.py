@@ -2,6 +2,11 @@ import sys
 import os
 from typing import Optional
 import io
+import re
+import asyncio
+import contextlib
+import functools
+import threading
 # Add the project root directory to the Python path to ensure modules can be found.
 project_root = os.path.dirname(os.path.abspath(__file__))
 if project_root not in sys.path:
@@ -15,8 +20,12 @@ except (ValueError, ImportError) as e:
     print("\nThis may be due to a missing dependency, a problem in the agent/tool files, or an invalid .env configuration.", file=sys.stderr)
     raise
 
-# Lazy-load the agent to avoid heavy imports at startup
-_agent_executor = None
+# Verbose capture swaps the process-wide sys.stdout/sys.stderr, so only one
+# verbose run may hold the redirect at a time
+_verbose_lock = threading.Lock()
+
+# Agent outputs that mean the provider rejected our credentials
+_AUTH_FAIL_RE = re.compile(r"Authentication failed|invalid credentials")
 
 try:
     from google.auth.exceptions import DefaultCredentialsError
@@ -40,7 +49,55 @@ class AnthropicAuthError(Exception):
 class AnthropicRateLimitError(Exception):
     pass
 
-from langchain_core.messages import HumanMessage, AIMessage
+@functools.lru_cache(maxsize=1)
+def _get_agent_executor():
+    """Import the agent on first use (lazy, to avoid heavy imports at startup)."""
+    from agent import agent_executor
+    return agent_executor
+
+if config.AGENT_PRELOAD and config.AGENT_ENABLED:
+    # Warm the agent import in the background so the first request finds it cached
+    threading.Thread(target=_get_agent_executor, name="agent-preload", daemon=True).start()
+
+def _agent_result(output: str, verbose_log: Optional[str]) -> tuple[bool, str, Optional[str]]:
+    """Turn the agent's raw output into the (success_status, agent_output, verbose_log) tuple."""
+    if not output:
+        output = "I'm sorry, I couldn't produce an output. Please try rephrasing your request."
+    elif _AUTH_FAIL_RE.search(output):
+        return False, output, verbose_log
+    return True, output, verbose_log
+
+def _provider_error_result(e: Exception, verbose_log: Optional[str]) -> Optional[tuple[bool, str, Optional[str]]]:
+    """
+    Map OpenAI/Anthropic auth and quota errors to a failure tuple; returns None
+    for anything else so the caller re-raises it.
+    """
+    # Map provider-specific errors without importing heavy SDKs at startup
+    ename = e.__class__.__name__
+    emod = getattr(e.__class__, "__module__", "")
+    if ("openai" in emod and ename in ("AuthenticationError",)) or (
+        "anthropic" in emod and ename in ("AuthenticationError",)
+    ):
+        provider_name = config.LLM_PROVIDER.capitalize()
+        error_message = (
+            f"\n--- {provider_name} Authentication Error ---\n"
+            f"The API key is invalid, expired, or not authorized. "
+            f"Please check your {provider_name.upper()}_API_KEY in the .env file."
+        )
+        print(error_message, file=sys.stderr)
+        return False, error_message, verbose_log
+    if ("openai" in emod and ename in ("RateLimitError",)) or (
+        "anthropic" in emod and ename in ("RateLimitError",)
+    ):
+        provider_name = config.LLM_PROVIDER.capitalize()
+        error_message = (
+            f"\n--- {provider_name} API Quota Exceeded ---\n"
+            f"You have exceeded your current quota for the {provider_name} API. "
+            f"Please check your plan and billing details on their website."
+        )
+        print(error_message, file=sys.stderr)
+        return False, error_message, verbose_log
+    return None
 
 def process_agent_request(prompt: str, chat_history: list) -> tuple[bool, str, Optional[str]]:
     """
@@ -49,65 +106,34 @@ def process_agent_request(prompt: str, chat_history: list) -> tuple[bool, str, O
     """
     verbose_log = None
     try:
-        global _agent_executor
-        if _agent_executor is None:
-            from agent import agent_executor as _ae
-            _agent_executor = _ae
+        agent_executor = _get_agent_executor()
         if config.AGENT_VERBOSE:
-            # Redirect stdout and stderr to capture verbose output
-            old_stdout = sys.stdout
-            old_stderr = sys.stderr
+            # Capture verbose output; the with-block restores stdout/stderr
+            # even when invoke() raises
             redirected_output = io.StringIO()
-            sys.stdout = redirected_output
-            sys.stderr = redirected_output
-
-        result = _agent_executor.invoke({
-            "input": prompt,
-            "chat_history": chat_history
-        })
-        output = result.get('output', '')
-
-        if config.AGENT_VERBOSE:
-            sys.stdout = old_stdout # Restore original stdout
-            sys.stderr = old_stderr # Restore original stderr
+            with _verbose_lock, contextlib.redirect_stdout(redirected_output), \
+                    contextlib.redirect_stderr(redirected_output):
+                result = agent_executor.invoke({
+                    "input": prompt,
+                    "chat_history": chat_history
+                })
             verbose_log = redirected_output.getvalue()
             # Optionally, print to the server console as well for local debugging
             print("\n--- AGENT VERBOSE LOG (captured) ---", file=sys.stderr)
             print(verbose_log, file=sys.stderr)
             print("------------------------------------", file=sys.stderr)
+        else:
+            result = agent_executor.invoke({
+                "input": prompt,
+                "chat_history": chat_history
+            })
 
-        if not output:
-            output = "I'm sorry, I couldn't produce an output. Please try rephrasing your request."
-        elif "Authentication failed" in output or "invalid credentials" in output:
-            return False, output, verbose_log
-        return True, output, verbose_log
+        return _agent_result(result.get('output', ''), verbose_log)
     except Exception as e:
-        # Map provider-specific errors without importing heavy SDKs at startup
-        ename = e.__class__.__name__
-        emod = getattr(e.__class__, "__module__", "")
-        if ("openai" in emod and ename in ("AuthenticationError",)) or (
-            "anthropic" in emod and ename in ("AuthenticationError",)
-        ):
-            provider_name = config.LLM_PROVIDER.capitalize()
-            error_message = (
-                f"\n--- {provider_name} Authentication Error ---\n"
-                f"The API key is invalid, expired, or not authorized. "
-                f"Please check your {provider_name.upper()}_API_KEY in the .env file."
-            )
-            print(error_message, file=sys.stderr)
-            return False, error_message, verbose_log
-        if ("openai" in emod and ename in ("RateLimitError",)) or (
-            "anthropic" in emod and ename in ("RateLimitError",)
-        ):
-            provider_name = config.LLM_PROVIDER.capitalize()
-            error_message = (
-                f"\n--- {provider_name} API Quota Exceeded ---\n"
-                f"You have exceeded your current quota for the {provider_name} API. "
-                f"Please check your plan and billing details on their website."
-            )
-            print(error_message, file=sys.stderr)
-            return False, error_message, verbose_log
-        raise
+        handled = _provider_error_result(e, verbose_log)
+        if handled is None:
+            raise
+        return handled
     except DefaultCredentialsError:
         # This error occurs if the API key is present but invalid or not authorized.
         error_message = (
@@ -132,4 +158,25 @@ def process_agent_request(prompt: str, chat_history: list) -> tuple[bool, str, O
     except Exception as e:
         error_message = f"\nAn unexpected error occurred: {e}"
         print(error_message, file=sys.stderr) # Still print to server console
-        return False, error_message, verbose_log
\ No newline at end of file
+        return False, error_message, verbose_log
+
+async def aprocess_agent_request(prompt: str, chat_history: list) -> tuple[bool, str, Optional[str]]:
+    """
+    Async variant of process_agent_request: awaits the agent's LLM calls so
+    several requests can overlap, e.g. with asyncio.gather().
+    """
+    if config.AGENT_VERBOSE:
+        # Verbose capture redirects process-wide streams; run it on a worker
+        # thread where the synchronous path serializes it
+        return await asyncio.to_thread(process_agent_request, prompt, chat_history)
+    try:
+        result = await _get_agent_executor().ainvoke({
+            "input": prompt,
+            "chat_history": chat_history
+        })
+        return _agent_result(result.get('output', ''), None)
+    except Exception as e:
+        handled = _provider_error_result(e, None)
+        if handled is None:
+            raise
+        return handled